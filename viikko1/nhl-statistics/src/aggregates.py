@@ -0,0 +1,87 @@
+from heapq import nlargest
+
+
+def key_function(key):
+    if callable(key):
+        return key
+
+    return lambda player: getattr(player, key)
+
+
+class GroupStats:
+    def __init__(self):
+        self.players = []
+        self.goals = 0
+        self.assists = 0
+
+    @property
+    def count(self):
+        return len(self.players)
+
+    @property
+    def points(self):
+        return self.goals + self.assists
+
+    def add(self, player):
+        self.players.append(player)
+        self.goals += player.goals
+        self.assists += player.assists
+
+    def remove(self, player):
+        self.players.remove(player)
+        self.goals -= player.goals
+        self.assists -= player.assists
+
+    def update(self, goals, assists):
+        self.goals += goals
+        self.assists += assists
+
+    def mean(self, attr):
+        if not self.players:
+            return 0
+
+        return getattr(self, attr) / self.count
+
+    def top(self, how_many, key=lambda player: player.points):
+        return nlargest(how_many, self.players, key=key)
+
+    def summary(self):
+        return {
+            "count": self.count,
+            "goals": self.goals,
+            "assists": self.assists,
+            "points": self.points,
+            "mean_goals": self.mean("goals"),
+            "mean_assists": self.mean("assists"),
+            "mean_points": self.mean("points")
+        }
+
+
+def group_players(players, key):
+    group_of = key_function(key)
+    groups = {}
+
+    for player in players:
+        group = groups.get(group_of(player))
+
+        if group is None:
+            group = groups[group_of(player)] = GroupStats()
+
+        group.add(player)
+
+    return groups
+
+
+def regroup_player(groups, player, old_group, new_group, goals, assists):
+    groups[old_group].update(goals, assists)
+
+    if old_group == new_group:
+        return
+
+    # ryhmittelyavain muuttui: pelaaja siirretään päivitettyine tilastoineen uuteen ryhmään
+    groups[old_group].remove(player)
+
+    if not groups[old_group].players:
+        del groups[old_group]
+
+    groups.setdefault(new_group, GroupStats()).add(player)
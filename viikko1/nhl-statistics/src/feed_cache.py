@@ -0,0 +1,92 @@
+import hashlib
+import io
+import json
+import mmap
+import os
+import time
+from urllib import request
+from urllib.error import HTTPError, URLError
+
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "nhlstats")
+DEFAULT_TIMEOUT = 10
+
+
+class FeedCache:
+    def __init__(self, directory=DEFAULT_CACHE_DIRECTORY, max_age=3600, timeout=DEFAULT_TIMEOUT):
+        self._directory = directory
+        self._max_age = max_age
+        self._timeout = timeout
+
+    def open(self, url):
+        data_path, meta_path = self._paths(url)
+        meta = self._read_meta(meta_path) if os.path.exists(data_path) else None
+
+        if not meta or time.time() - meta["fetched_at"] >= self._max_age:
+            self._revalidate(url, meta)
+
+        return self._map(data_path)
+
+    def _revalidate(self, url, meta):
+        data_path, meta_path = self._paths(url)
+
+        try:
+            with request.urlopen(self._request(url, meta), timeout=self._timeout) as response:
+                self._write(data_path, response.read())
+                meta = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified")
+                }
+        except HTTPError as error:
+            if not meta:
+                raise
+            # muut kuin 304 Not Modified -vastaukset ovat palvelinvirheitä, joten käytetään vanhaa kopiota
+            if error.code != 304:
+                return
+        except (URLError, TimeoutError):
+            # verkkovirheen sattuessa käytetään vanhaa kopiota, jos sellainen on
+            if not meta:
+                raise
+            return
+
+        meta["fetched_at"] = time.time()
+        self._write(meta_path, json.dumps(meta).encode("utf-8"))
+
+    def _request(self, url, meta):
+        headers = {}
+
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+        return request.Request(url, headers=headers)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()[:32]
+        base = os.path.join(self._directory, key)
+
+        return f"{base}.data", f"{base}.json"
+
+    def _read_meta(self, meta_path):
+        try:
+            with open(meta_path, "rb") as meta_file:
+                return json.loads(meta_file.read())
+        except (OSError, ValueError):
+            return None
+
+    def _write(self, path, content):
+        os.makedirs(self._directory, exist_ok=True)
+        temporary_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(temporary_path, "wb") as target:
+            target.write(content)
+
+        os.replace(temporary_path, path)
+
+    def _map(self, data_path):
+        with open(data_path, "rb") as data_file:
+            if os.fstat(data_file.fileno()).st_size == 0:
+                return io.BytesIO(b"")
+
+            return mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
@@ -1,9 +1,10 @@
 from statistics_service import StatisticsService, SortBy
 from player_reader import PlayerReader
+from feed_cache import FeedCache
 
 
 def main():
-    stats = StatisticsService(PlayerReader("https://studies.cs.helsinki.fi/nhlstats/2024-25/players.txt"))
+    stats = StatisticsService(PlayerReader("https://studies.cs.helsinki.fi/nhlstats/2024-25/players.txt", FeedCache()))
     philadelphia_flyers_players = stats.team("PHI")
     top_scorers = stats.top(10)
 
@@ -0,0 +1,81 @@
+import argparse
+import json
+import random
+import sys
+import tracemalloc
+from player import Player
+
+TEAMS = ["PHI", "EDM", "NYR", "BOS", "COL", "FLA", "DET", "PIT", "TOR", "MTL"]
+NATIONALITIES = ["CAN", "USA", "FIN", "SWE", "CZE", "RUS"]
+
+
+class DictPlayer:
+    # aiempi toteutus vertailukohdaksi: attribuutit oliokohtaisessa __dict__:ssä
+    def __init__(self, name, team, goals, assists, nationality=None):
+        self.name = name
+        self.team = team
+        self.goals = goals
+        self.assists = assists
+        self.nationality = nationality
+
+    @property
+    def points(self):
+        return self.goals + self.assists
+
+
+def feed_lines(how_many, seed=1):
+    rng = random.Random(seed)
+
+    for i in range(how_many):
+        team, nationality = rng.choice(TEAMS), rng.choice(NATIONALITIES)
+        yield f"Player {i};{team};{nationality};{rng.randint(0, 50)};{rng.randint(0, 70)}".encode("utf-8")
+
+
+def read_players(player_class, lines):
+    players = []
+
+    # kentät puretaan kuten PlayerReaderissa, jolloin jokainen merkkijono on uusi olio
+    for line in lines:
+        parts = line.split(b";")
+        players.append(player_class(
+            parts[0].decode("utf-8"),
+            parts[1].decode("utf-8"),
+            int(parts[3]),
+            int(parts[4]),
+            parts[2].decode("utf-8")
+        ))
+
+    return players
+
+
+def bytes_per_player(player_class, how_many):
+    lines = list(feed_lines(how_many))
+
+    tracemalloc.start()
+    players = read_players(player_class, lines)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return size / len(players)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure memory used per Player instance")
+    parser.add_argument("--sizes", default="1000,100000,1000000",
+                        help="comma separated player counts")
+    arguments = parser.parse_args(argv)
+
+    for size in (int(size) for size in arguments.sizes.split(",")):
+        before = bytes_per_player(DictPlayer, size)
+        after = bytes_per_player(Player, size)
+
+        print(json.dumps({
+            "size": size,
+            "dict_bytes_per_player": round(before, 1),
+            "slotted_bytes_per_player": round(after, 1),
+            "saved": round(1 - after / before, 3)
+        }), flush=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,71 @@
+from bisect import bisect_left
+
+GRAM_LENGTH = 3
+
+
+def trigrams(text):
+    return {text[i:i + GRAM_LENGTH] for i in range(len(text) - GRAM_LENGTH + 1)}
+
+
+class NameIndex:
+    def __init__(self, names=()):
+        self._names = []
+        self._folded = []
+        self._grams = {}
+        self._sorted = None
+
+        for name in names:
+            self.add(name)
+
+    def add(self, name):
+        row = len(self._names)
+        folded = name.casefold()
+
+        self._names.append(name)
+        self._folded.append(folded)
+        self._sorted = None
+
+        for gram in trigrams(folded):
+            self._grams.setdefault(gram, []).append(row)
+
+    def find_first(self, text, ignore_case=False):
+        for row in self._matching_rows(text, ignore_case):
+            return row
+
+        return None
+
+    def find_all(self, text, ignore_case=False):
+        return list(self._matching_rows(text, ignore_case))
+
+    def find_prefix(self, text, ignore_case=False):
+        folded = text.casefold()
+        rows = []
+
+        if self._sorted is None:
+            self._sorted = sorted((name, row) for row, name in enumerate(self._folded))
+
+        for name, row in self._sorted[bisect_left(self._sorted, (folded,)):]:
+            if not name.startswith(folded):
+                break
+            if ignore_case or self._names[row].startswith(text):
+                rows.append(row)
+
+        return rows
+
+    def _candidates(self, folded):
+        if len(folded) < GRAM_LENGTH:
+            return range(len(self._names))
+
+        postings = [self._grams.get(gram, []) for gram in trigrams(folded)]
+
+        return min(postings, key=len)
+
+    def _matching_rows(self, text, ignore_case):
+        folded = text.casefold()
+
+        for row in self._candidates(folded):
+            if ignore_case:
+                if folded in self._folded[row]:
+                    yield row
+            elif text in self._names[row]:
+                yield row
@@ -1,13 +1,39 @@
+import sys
+
+
 class Player:
-    def __init__(self, name, team, goals, assists):
+    # __slots__ poistaa oliokohtaisen __dict__:n, joukkue- ja maakoodit jaetaan internoinnilla
+    __slots__ = ("name", "team", "nationality", "_goals", "_assists", "_points")
+
+    def __init__(self, name, team, goals, assists, nationality=None):
         self.name = name
-        self.team = team
-        self.goals = goals
-        self.assists = assists
+        self.team = sys.intern(team)
+        self.nationality = sys.intern(nationality) if nationality else nationality
+        self._goals = goals
+        self._assists = assists
+        self._points = goals + assists
+
+    @property
+    def goals(self):
+        return self._goals
+
+    @goals.setter
+    def goals(self, goals):
+        self._goals = goals
+        self._points = goals + self._assists
+
+    @property
+    def assists(self):
+        return self._assists
+
+    @assists.setter
+    def assists(self, assists):
+        self._assists = assists
+        self._points = self._goals + assists
 
     @property
     def points(self):
-        return self.goals + self.assists
+        return self._points
 
     def __str__(self):
         return f"{self.name} {self.team} {self.goals} + {self.assists} = {self.points}"
@@ -2,25 +2,28 @@ from urllib import request
 from player import Player
 
 class PlayerReader:
-    def __init__(self, url):
+    def __init__(self, url, cache=None):
         self._url = url
+        self._cache = cache
 
     def get_players(self):
-        players_file = request.urlopen(self._url)
-        players = []
-
-        for line in players_file:
-            decoded_line = line.decode("utf-8")
-            parts = decoded_line.split(";")
+        # pelaajat palautetaan sitä mukaa kuin rivejä saapuu
+        for line in self._lines():
+            parts = line.split(b";")
 
             if len(parts) > 3:
-                player = Player(
-                    parts[0].strip(),
-                    parts[1].strip(),
-                    int(parts[3].strip()),
-                    int(parts[4].strip())
+                yield Player(
+                    parts[0].strip().decode("utf-8"),
+                    parts[1].strip().decode("utf-8"),
+                    int(parts[3]),
+                    int(parts[4]),
+                    parts[2].strip().decode("utf-8")
                 )
 
-                players.append(player)
-
-        return players
+    def _lines(self):
+        if self._cache is None:
+            with request.urlopen(self._url) as players_file:
+                yield from players_file
+        else:
+            with self._cache.open(self._url) as players_file:
+                yield from iter(players_file.readline, b"")
@@ -0,0 +1,221 @@
+import json
+import os
+import sys
+import threading
+from collections import OrderedDict
+from flask import Flask, Response, abort, request
+from statistics_service import StatisticsService, SortBy
+from player_reader import PlayerReader
+from feed_cache import FeedCache
+from snapshot import SnapshotReader, SnapshotError, write_snapshot
+
+PLAYERS_URL = "https://studies.cs.helsinki.fi/nhlstats/2024-25/players.txt"
+SNAPSHOT_PATH = os.path.join(os.path.expanduser("~"), ".cache", "nhlstats", "players.nhls")
+
+
+def player_json(player):
+    return {
+        "name": player.name,
+        "team": player.team,
+        "nationality": player.nationality,
+        "goals": player.goals,
+        "assists": player.assists,
+        "points": player.points
+    }
+
+
+class ResponseCache:
+    def __init__(self, max_size=1024):
+        self._max_size = max_size
+        self._responses = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, compute):
+        with self._lock:
+            body = self._responses.get(key)
+
+            if body is not None:
+                self._responses.move_to_end(key)
+                self.hits += 1
+                return body
+
+            self.misses += 1
+
+        body = json.dumps(compute())
+
+        with self._lock:
+            self._responses[key] = body
+            if len(self._responses) > self._max_size:
+                self._responses.popitem(last=False)
+
+        return body
+
+    def clear(self):
+        with self._lock:
+            self._responses.clear()
+
+    def __len__(self):
+        return len(self._responses)
+
+
+class StatisticsServer:
+    def __init__(self, url=PLAYERS_URL, snapshot_path=SNAPSHOT_PATH, feed_cache=None, cache_size=1024):
+        self._url = url
+        self._snapshot_path = snapshot_path
+        self._feed_cache = feed_cache
+        self._lock = threading.Lock()
+        self.cache = ResponseCache(cache_size)
+        self.generation = 0
+        self.stats = None
+
+    def start(self):
+        # lämmin käynnistys: pelaajat luetaan tilannekuvasta, jos sellainen on jo tallennettu
+        try:
+            self.stats = StatisticsService(SnapshotReader(self._snapshot_path))
+        except (OSError, SnapshotError):
+            self.reload()
+
+        return self
+
+    def reload(self):
+        stats = StatisticsService(PlayerReader(self._url, self._feed_cache))
+
+        if self._snapshot_path:
+            os.makedirs(os.path.dirname(self._snapshot_path) or ".", exist_ok=True)
+            write_snapshot(self._snapshot_path, stats.players())
+
+        # uusi palvelu rakennetaan lukon ulkopuolella ja vaihdetaan kerralla
+        with self._lock:
+            self.stats = stats
+            self._invalidate()
+
+    def query(self, compute):
+        # update_player muuttaa järjestyksiä ja ryhmiä paikallaan, joten lukijat odottavat päivityksen loppuun
+        with self._lock:
+            return compute(self.stats)
+
+    def update_player(self, name, goals, assists):
+        with self._lock:
+            player = self.stats.update_player(name, goals, assists)
+            self._invalidate()
+
+            return player_json(player)
+
+    def _invalidate(self):
+        # sukupolvi on osa avainta, joten muutosta ennen aloitettu laskenta ei päädy uusien pyyntöjen vastaukseksi
+        self.generation += 1
+        self.cache.clear()
+
+
+def int_argument(name, default):
+    try:
+        value = int(request.args.get(name, default))
+    except ValueError:
+        abort(400, f"{name} must be an integer")
+
+    if value < 0:
+        abort(400, f"{name} must not be negative")
+
+    return value
+
+
+def sort_by_argument():
+    try:
+        return SortBy[request.args.get("sort_by", "points").upper()]
+    except KeyError:
+        abort(400, "sort_by must be one of " + ", ".join(factor.name.lower() for factor in SortBy))
+
+
+def create_app(server):
+    app = Flask(__name__)
+
+    def cached(key, compute):
+        body = server.cache.get((server.generation, *key), lambda: server.query(compute))
+
+        return Response(body, mimetype="application/json")
+
+    @app.route("/ping")
+    def ping():
+        return "Pong"
+
+    @app.route("/team/<team_name>")
+    def team(team_name):
+        return cached(("team", team_name), lambda stats: [player_json(player) for player in stats.team(team_name)])
+
+    @app.route("/top")
+    def top():
+        how_many = int_argument("how_many", 10)
+        sort_by_factor = sort_by_argument()
+
+        return cached(
+            ("top", how_many, sort_by_factor),
+            lambda stats: [player_json(player) for player in stats.top(how_many, sort_by_factor)]
+        )
+
+    @app.route("/search")
+    def search():
+        name = request.args.get("name", "")
+        ignore_case = request.args.get("ignore_case") == "true"
+        prefix = request.args.get("prefix") == "true"
+
+        def compute(stats):
+            if prefix:
+                return [player_json(player) for player in stats.search_prefix(name, ignore_case)]
+
+            return [player_json(player) for player in stats.search_all(name, ignore_case)]
+
+        return cached(("search", name, ignore_case, prefix), compute)
+
+    @app.route("/nationality/<nationality>")
+    def top_scorers_by_nationality(nationality):
+        how_many = int_argument("how_many", 10)
+
+        def compute(stats):
+            group = stats.group_by("nationality").get(nationality)
+
+            return [player_json(player) for player in group.top(how_many)] if group else []
+
+        return cached(("nationality", nationality, how_many), compute)
+
+    @app.route("/aggregate")
+    def aggregate():
+        key = request.args.get("key", "team")
+
+        if key not in ("team", "nationality"):
+            abort(400, "key must be team or nationality")
+
+        return cached(("aggregate", key), lambda stats: stats.aggregate(key))
+
+    @app.route("/players/<name>", methods=["POST"])
+    def update_player(name):
+        body = request.get_json(silent=True) or {}
+
+        try:
+            goals, assists = int(body.get("goals", 0)), int(body.get("assists", 0))
+        except (TypeError, ValueError):
+            abort(400, "goals and assists must be integers")
+
+        try:
+            return server.update_player(name, goals, assists)
+        except ValueError as error:
+            abort(404, str(error))
+
+    @app.route("/reload", methods=["POST"])
+    def reload():
+        server.reload()
+        return "Reloaded"
+
+    return app
+
+
+def main(argv):
+    port = int(argv[0]) if argv else 5001
+    server = StatisticsServer(feed_cache=FeedCache()).start()
+
+    create_app(server).run(port=port, threaded=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
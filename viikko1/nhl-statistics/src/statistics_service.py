@@ -1,5 +1,11 @@
 from player_reader import PlayerReader
 from enum import Enum
+from heapq import nlargest
+from name_index import NameIndex
+from aggregates import group_players, key_function, regroup_player
+
+# pienille k:n arvoille ilman valmista järjestystä käytetään heapq.nlargestia
+PARTIAL_SELECTION_LIMIT = 50
 
 class SortBy(Enum):
     POINTS = 1
@@ -8,16 +14,103 @@ class SortBy(Enum):
 
 class StatisticsService:
     def __init__(self, player_reader):
-        reader = player_reader
+        self._player_reader = player_reader
+        self._sort_keys = {
+            SortBy.POINTS: lambda player: player.points,
+            SortBy.GOALS: lambda player: player.goals,
+            SortBy.ASSISTS: lambda player: player.assists
+        }
+        self.reload()
 
-        self._players = reader.get_players()
+    def reload(self):
+        self._players = []
+        self._name_index = NameIndex()
+        self._rankings = {}
+        self._groups = {}
+
+        # indeksoidaan pelaajat sitä mukaa kuin lukija palauttaa niitä
+        for player in self._player_reader.get_players():
+            self._players.append(player)
+            self._name_index.add(player.name)
+
+        for sort_by_factor in SortBy:
+            self._rankings[sort_by_factor] = self._ranking(sort_by_factor)
+
+    def register_sort_key(self, sort_by_factor, key, precompute=False):
+        self._sort_keys[sort_by_factor] = key
+        self._rankings.pop(sort_by_factor, None)
+
+        if precompute:
+            self._rankings[sort_by_factor] = self._ranking(sort_by_factor)
+
+    def update_player(self, name, goals=0, assists=0):
+        for row, player in enumerate(self._players):
+            if player.name == name:
+                for ranking in self._rankings.values():
+                    ranking.remove(row)
+
+                old_groups = {key: key_function(key)(player) for key in self._groups}
+
+                player.goals += goals
+                player.assists += assists
+
+                for sort_by_factor, ranking in self._rankings.items():
+                    self._insert(ranking, row, self._sort_keys[sort_by_factor])
+
+                for key, groups in self._groups.items():
+                    regroup_player(groups, player, old_groups[key], key_function(key)(player), goals, assists)
 
-    def search(self, name):
-        for player in self._players:
-            if name in player.name:
                 return player
 
-        return None
+        raise ValueError(f"Unknown player: {name}")
+
+    def _ranking(self, sort_by_factor):
+        key = self._sort_keys[sort_by_factor]
+
+        # reverse=True säilyttää tasatilanteissa rivijärjestyksen, eikä avaimen tarvitse olla numeerinen
+        return sorted(range(len(self._players)), key=lambda row: key(self._players[row]), reverse=True)
+
+    def _insert(self, ranking, row, key):
+        value = key(self._players[row])
+        low, high = 0, len(ranking)
+
+        while low < high:
+            middle = (low + high) // 2
+            other = key(self._players[ranking[middle]])
+
+            if other > value or (other == value and ranking[middle] < row):
+                low = middle + 1
+            else:
+                high = middle
+
+        ranking.insert(low, row)
+
+    def players(self):
+        return list(self._players)
+
+    def search(self, name):
+        row = self._name_index.find_first(name)
+
+        return self._players[row] if row is not None else None
+
+    def search_all(self, name, ignore_case=False):
+        return [self._players[row] for row in self._name_index.find_all(name, ignore_case)]
+
+    def search_prefix(self, prefix, ignore_case=False):
+        return [self._players[row] for row in self._name_index.find_prefix(prefix, ignore_case)]
+
+    def group_by(self, key="team"):
+        # ryhmittely lasketaan kerran ja pidetään ajan tasalla update_playerissa
+        groups = self._groups.get(key)
+
+        if groups is None:
+            groups = group_players(self._players, key)
+            self._groups[key] = groups
+
+        return groups
+
+    def aggregate(self, key="team"):
+        return {group: stats.summary() for group, stats in self.group_by(key).items()}
 
     def team(self, team_name):
         players_of_team = filter(
@@ -28,26 +121,17 @@ class StatisticsService:
         return list(players_of_team)
 
     def top(self, how_many, sort_by_factor = SortBy.POINTS):
-        # metodin käyttämä apufufunktio voidaan määritellä näin
-        def sort_by(player):
-            if sort_by_factor == SortBy.POINTS:
-                return player.points
-            if sort_by_factor == SortBy.GOALS:
-                return player.goals
-            if sort_by_factor == SortBy.ASSISTS:
-                return player.assists
-
-        sorted_players = sorted(
-            self._players,
-            reverse=True,
-            key=sort_by
-        )
+        # palautetaan how_many + 1 pelaajaa kuten ennenkin
+        count = max(how_many + 1, 0)
+        ranking = self._rankings.get(sort_by_factor)
+
+        if ranking is None and count <= PARTIAL_SELECTION_LIMIT:
+            return nlargest(count, self._players, key=self._sort_keys[sort_by_factor])
+
+        if ranking is None:
+            ranking = self._ranking(sort_by_factor)
+            self._rankings[sort_by_factor] = ranking
 
-        result = []
-        i = 0
-        while i <= how_many:
-            result.append(sorted_players[i])
-            i += 1
+        return [self._players[row] for row in ranking[:count]]
 
-        return result
     
\ No newline at end of file
@@ -0,0 +1,107 @@
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError
+from feed_cache import FeedCache
+from player_reader import PlayerReader
+
+PLAYERS_FILE = b"Wayne Gretzky;EDM;CAN;35;89;80\nJari Kurri;EDM;FIN;37;53;80\n"
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    requests = []
+    status = 200
+    delay = 0
+
+    def do_GET(self):
+        FeedHandler.requests.append(self.headers.get("If-None-Match"))
+        time.sleep(FeedHandler.delay)
+
+        if FeedHandler.status != 200:
+            self.send_response(FeedHandler.status)
+            self.end_headers()
+            return
+
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.send_header("Content-Length", str(len(PLAYERS_FILE)))
+        self.end_headers()
+        self.wfile.write(PLAYERS_FILE)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestFeedCache(unittest.TestCase):
+    def setUp(self):
+        FeedHandler.requests = []
+        FeedHandler.status = 200
+        FeedHandler.delay = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FeedHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/players.txt"
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.directory)
+
+    def test_syote_tallennetaan_ja_luetaan_valimuistista(self):
+        cache = FeedCache(self.directory)
+
+        with cache.open(self.url) as feed:
+            self.assertEqual(feed.read(), PLAYERS_FILE)
+        with cache.open(self.url) as feed:
+            self.assertEqual(feed.read(), PLAYERS_FILE)
+
+        self.assertEqual(FeedHandler.requests, [None])
+
+    def test_vanhentunut_kopio_tarkistetaan_etagilla(self):
+        cache = FeedCache(self.directory, max_age=0)
+
+        cache.open(self.url).close()
+
+        with cache.open(self.url) as feed:
+            self.assertEqual(feed.read(), PLAYERS_FILE)
+
+        self.assertEqual(FeedHandler.requests, [None, '"v1"'])
+
+    def test_lukija_kayttaa_valimuistia(self):
+        reader = PlayerReader(self.url, FeedCache(self.directory))
+
+        self.assertEqual([player.name for player in reader.get_players()], ["Wayne Gretzky", "Jari Kurri"])
+        self.assertEqual(len(list(reader.get_players())), 2)
+        self.assertEqual(len(FeedHandler.requests), 1)
+
+    def test_palvelinvirheessa_kaytetaan_tallennettua_kopiota(self):
+        cache = FeedCache(self.directory, max_age=0)
+        cache.open(self.url).close()
+        FeedHandler.status = 503
+
+        with cache.open(self.url) as feed:
+            self.assertEqual(feed.read(), PLAYERS_FILE)
+
+        self.assertEqual(FeedHandler.requests, [None, '"v1"'])
+
+    def test_palvelinvirhe_ilman_kopiota_nostetaan(self):
+        FeedHandler.status = 500
+
+        with self.assertRaises(HTTPError):
+            FeedCache(self.directory).open(self.url)
+
+    def test_aikakatkaisussa_kaytetaan_tallennettua_kopiota(self):
+        cache = FeedCache(self.directory, max_age=0, timeout=0.1)
+        cache.open(self.url).close()
+        FeedHandler.delay = 0.5
+
+        with cache.open(self.url) as feed:
+            self.assertEqual(feed.read(), PLAYERS_FILE)
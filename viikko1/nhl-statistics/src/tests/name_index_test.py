@@ -0,0 +1,35 @@
+import unittest
+from name_index import NameIndex
+
+
+class TestNameIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = NameIndex([
+            "Wayne Gretzky",
+            "Jari Kurri",
+            "Brent Gretzky",
+            "Mario Lemieux",
+            "Jarome Iginla"
+        ])
+
+    def test_ensimmainen_osuma_loytyy(self):
+        self.assertEqual(self.index.find_first("Gretzky"), 0)
+
+    def test_haku_erottaa_kirjainkoon_oletuksena(self):
+        self.assertEqual(self.index.find_first("gretzky"), None)
+        self.assertEqual(self.index.find_first("gretzky", ignore_case=True), 0)
+
+    def test_kaikki_osumat_loytyvat_jarjestyksessa(self):
+        self.assertEqual(self.index.find_all("etzk"), [0, 2])
+
+    def test_lyhyt_hakusana_toimii(self):
+        self.assertEqual(self.index.find_all("ar"), [1, 3, 4])
+
+    def test_alkuosalla_haku(self):
+        self.assertEqual(self.index.find_prefix("Jar"), [1, 4])
+        self.assertEqual(self.index.find_prefix("jar"), [])
+        self.assertEqual(self.index.find_prefix("jar", ignore_case=True), [1, 4])
+
+    def test_tuntematon_nimi_ei_loydy(self):
+        self.assertEqual(self.index.find_first("Stubb"), None)
+        self.assertEqual(self.index.find_prefix("Stubb"), [])
@@ -1,5 +1,5 @@
 import unittest
-from statistics_service import StatisticsService
+from statistics_service import StatisticsService, SortBy, PARTIAL_SELECTION_LIMIT
 from player import Player
 
 class PlayerReaderStub:
@@ -27,8 +27,96 @@ class TestStatisticsService(unittest.TestCase):
     def test_top_pelaajien_etsiminen(self):
         self.assertAlmostEqual(self.stats.top(1), [self.stats._players[4], self.stats._players[1]])
 
+    def test_negatiivinen_maara_palauttaa_tyhjan_listan(self):
+        self.assertEqual(self.stats.top(-2), [])
+        self.assertEqual(self.stats.top(-2, SortBy.GOALS), [])
+
     def test_vaara_nimi_haku_palauttaa_None(self):
         self.assertAlmostEqual(self.stats.search("Stubb"), None)
 
+    def test_pelaajan_tilastojen_paivitys_muuttaa_jarjestysta(self):
+        self.stats.update_player("Kurri", goals=20, assists=5)
 
-    
+        self.assertEqual(self.stats.search("Kurri").points, 115)
+        self.assertEqual(self.stats.top(1), [self.stats._players[4], self.stats._players[2]])
+
+    def test_tuntemattoman_pelaajan_paivitys_aiheuttaa_virheen(self):
+        with self.assertRaises(ValueError):
+            self.stats.update_player("Stubb", goals=1)
+
+    def test_top_pelaajat_maalien_perusteella(self):
+        self.assertEqual(self.stats.top(1, SortBy.GOALS), [self.stats._players[1], self.stats._players[3]])
+
+    def test_top_pelaajat_syottojen_perusteella(self):
+        self.assertEqual(self.stats.top(2, SortBy.ASSISTS), [self.stats._players[4], self.stats._players[3], self.stats._players[1]])
+
+    def test_uuden_jarjestysavaimen_rekisterointi(self):
+        self.stats.register_sort_key("shortest_name", lambda player: -len(player.name))
+
+        self.assertEqual(self.stats.top(0, "shortest_name"), [self.stats._players[2]])
+
+    def test_merkkijonoavain(self):
+        self.stats.register_sort_key("name", lambda player: player.name)
+
+        self.assertEqual([player.name for player in self.stats.top(2, "name")], ["Yzerman", "Semenko", "Lemieux"])
+        self.assertEqual(
+            [player.name for player in self.stats.top(PARTIAL_SELECTION_LIMIT, "name")],
+            ["Yzerman", "Semenko", "Lemieux", "Kurri", "Gretzky"]
+        )
+
+    def test_merkkijonoavaimen_jarjestys_paivittyy(self):
+        self.stats.register_sort_key("team", lambda player: player.team, precompute=True)
+        self.stats.update_player("Kurri", goals=1)
+
+        self.assertEqual(
+            [player.name for player in self.stats.top(4, "team")],
+            ["Lemieux", "Semenko", "Kurri", "Gretzky", "Yzerman"]
+        )
+
+    def test_esilasketun_jarjestysavaimen_rekisterointi(self):
+        self.stats.register_sort_key("goals_minus_assists", lambda player: player.goals - player.assists, precompute=True)
+
+        self.assertEqual(self.stats.top(0, "goals_minus_assists"), [self.stats._players[0]])
+
+    def test_joukkueiden_yhteenveto(self):
+        totals = self.stats.aggregate("team")
+
+        self.assertEqual(totals["EDM"]["count"], 3)
+        self.assertEqual(totals["EDM"]["goals"], 76)
+        self.assertEqual(totals["EDM"]["points"], 230)
+        self.assertAlmostEqual(totals["PIT"]["mean_points"], 99)
+
+    def test_ryhman_parhaat_pelaajat(self):
+        edmonton = self.stats.group_by("team")["EDM"]
+
+        self.assertEqual(edmonton.top(2), [self.stats._players[4], self.stats._players[2]])
+
+    def test_ryhmittely_funktiolla(self):
+        groups = self.stats.group_by(lambda player: player.goals >= 40)
+
+        self.assertEqual(groups[True].count, 2)
+
+    def test_paivitys_siirtaa_pelaajan_toiseen_ryhmaan(self):
+        key = lambda player: player.goals >= 40
+        self.stats.group_by(key)
+        self.stats.update_player("Kurri", goals=5)
+
+        groups = self.stats.group_by(key)
+
+        self.assertEqual(groups[True].count, 3)
+        self.assertEqual(groups[True].goals, sum(player.goals for player in groups[True].players))
+        self.assertEqual(groups[False].goals, sum(player.goals for player in groups[False].players))
+
+    def test_paivitys_luo_puuttuvan_ryhman(self):
+        key = lambda player: player.goals >= 60
+        self.stats.group_by(key)
+        self.stats.update_player("Lemieux", goals=20)
+
+        self.assertEqual(self.stats.group_by(key)[True].players, [self.stats._players[1]])
+        self.assertEqual(self.stats.group_by(key)[False].count, 4)
+
+    def test_yhteenveto_paivittyy_pelaajan_muuttuessa(self):
+        self.stats.group_by("team")
+        self.stats.update_player("Kurri", goals=3, assists=1)
+
+        self.assertEqual(self.stats.aggregate("team")["EDM"]["points"], 234)
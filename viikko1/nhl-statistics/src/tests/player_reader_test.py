@@ -0,0 +1,37 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from player_reader import PlayerReader
+
+PLAYERS_FILE = (
+    "Wayne Gretzky;EDM;CAN;35;89;80\n"
+    "Jari Kurri ;EDM ;FIN; 37 ; 53 ;80\n"
+    "\n"
+    "Teemu Selänne;ANA;FIN;76;56;84\n"
+)
+
+
+class TestPlayerReader(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".txt")
+
+        with os.fdopen(handle, "w", encoding="utf-8") as players_file:
+            players_file.write(PLAYERS_FILE)
+
+        self.reader = PlayerReader(Path(self.path).as_uri())
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_pelaajat_luetaan_iteraattorina(self):
+        players = self.reader.get_players()
+
+        self.assertEqual(next(players).name, "Wayne Gretzky")
+
+    def test_kentat_siistitaan_ja_muunnetaan(self):
+        players = list(self.reader.get_players())
+
+        self.assertEqual(len(players), 3)
+        self.assertEqual(str(players[1]), "Jari Kurri EDM 37 + 53 = 90")
+        self.assertEqual(players[2].name, "Teemu Selänne")
@@ -0,0 +1,26 @@
+import unittest
+from player import Player
+
+
+class TestPlayer(unittest.TestCase):
+    def test_pisteet_paivittyvat_tilastojen_muuttuessa(self):
+        player = Player("Kurri", "EDM", 37, 53)
+        player.goals += 10
+        player.assists -= 3
+
+        self.assertEqual(player.points, 97)
+
+    def test_pisteita_ei_voi_asettaa_suoraan(self):
+        with self.assertRaises(AttributeError):
+            Player("Kurri", "EDM", 37, 53).points = 200
+
+    def test_joukkuekoodit_jaetaan_pelaajien_kesken(self):
+        first = Player("Kurri", "".join(["ED", "M"]), 37, 53, "FIN")
+        second = Player("Gretzky", "".join(["E", "DM"]), 35, 89, "".join(["FI", "N"]))
+
+        self.assertIs(first.team, second.team)
+        self.assertIs(first.nationality, second.nationality)
+
+    def test_pelaajalla_ei_ole_oliokohtaista_sanakirjaa(self):
+        with self.assertRaises(AttributeError):
+            Player("Kurri", "EDM", 37, 53).hits = 1
@@ -0,0 +1,107 @@
+import os
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from player import Player
+from snapshot import SnapshotReader, write_snapshot
+from server import StatisticsServer, create_app
+
+PLAYERS_FILE = (
+    "Lemieux;PIT;CAN;45;54;80\n"
+    "Kurri;EDM;FIN;37;53;80\n"
+    "Selänne;ANA;FIN;76;56;84\n"
+)
+
+
+class TestServer(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.snapshot_path = os.path.join(self.directory.name, "players.nhls")
+        self.players_path = os.path.join(self.directory.name, "players.txt")
+
+        with open(self.players_path, "w", encoding="utf-8") as players_file:
+            players_file.write(PLAYERS_FILE)
+
+        write_snapshot(self.snapshot_path, [
+            Player("Gretzky", "EDM", 35, 89, "CAN"),
+            Player("Kurri", "EDM", 37, 53, "FIN")
+        ])
+
+        self.server = StatisticsServer(Path(self.players_path).as_uri(), self.snapshot_path).start()
+        self.client = create_app(self.server).test_client()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_pelaajat_luetaan_tilannekuvasta(self):
+        names = [player["name"] for player in self.client.get("/team/EDM").get_json()]
+
+        self.assertEqual(names, ["Gretzky", "Kurri"])
+
+    def test_top_ja_jarjestysperuste(self):
+        response = self.client.get("/top?how_many=0&sort_by=goals")
+
+        self.assertEqual([player["name"] for player in response.get_json()], ["Kurri"])
+
+    def test_virheellinen_jarjestysperuste(self):
+        self.assertEqual(self.client.get("/top?sort_by=hits").status_code, 400)
+
+    def test_negatiivinen_maara_hylataan(self):
+        self.assertEqual(self.client.get("/top?how_many=-2").status_code, 400)
+        self.assertEqual(self.client.get("/nationality/FIN?how_many=-1").status_code, 400)
+
+    def test_toistuva_kysely_vastataan_valimuistista(self):
+        self.client.get("/search?name=kur&ignore_case=true")
+        response = self.client.get("/search?name=kur&ignore_case=true")
+
+        self.assertEqual(response.get_json()[0]["name"], "Kurri")
+        self.assertEqual(self.server.cache.hits, 1)
+
+    def test_paivitys_tyhjentaa_valimuistin(self):
+        self.client.get("/nationality/FIN")
+        self.client.post("/players/Kurri", json={"goals": 10})
+
+        self.assertEqual(self.client.get("/nationality/FIN").get_json()[0]["goals"], 47)
+
+    def test_tuntemattoman_pelaajan_paivitys(self):
+        self.assertEqual(self.client.post("/players/Stubb", json={"goals": 1}).status_code, 404)
+
+    def test_uudelleenlataus_paivittaa_tilannekuvan(self):
+        self.client.post("/reload")
+        restarted = StatisticsServer("file:///nonexistent", self.snapshot_path).start()
+
+        self.assertEqual(self.client.get("/nationality/FIN").get_json()[0]["name"], "Selänne")
+        self.assertEqual(restarted.stats.search("Lemieux").nationality, "CAN")
+
+    def test_lukijat_eivat_nae_kesken_olevaa_paivitysta(self):
+        write_snapshot(self.snapshot_path, [
+            Player(f"Player {i}", f"T{i % 7}", i % 50, i % 30, "FIN") for i in range(500)
+        ])
+        server = StatisticsServer(Path(self.players_path).as_uri(), self.snapshot_path, cache_size=0).start()
+        client = create_app(server).test_client()
+        stop = threading.Event()
+
+        def update():
+            while not stop.is_set():
+                server.update_player("Player 42", 1, 0)
+
+        updater = threading.Thread(target=update)
+        updater.start()
+
+        try:
+            for _ in range(200):
+                self.assertEqual(len(client.get("/top?how_many=499").get_json()), 500)
+                self.assertEqual(client.get("/aggregate").status_code, 200)
+        finally:
+            stop.set()
+            updater.join()
+
+    def test_katkennut_tilannekuva_ladataan_uudelleen(self):
+        with open(self.snapshot_path, "r+b") as target:
+            target.truncate(os.path.getsize(self.snapshot_path) // 2)
+
+        server = StatisticsServer(Path(self.players_path).as_uri(), self.snapshot_path).start()
+
+        self.assertEqual(server.stats.search("Selänne").team, "ANA")
+        self.assertEqual(len(list(SnapshotReader(self.snapshot_path).get_players())), 3)
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from player import Player
+from snapshot import Snapshot, SnapshotError, SnapshotReader, write_snapshot
+
+
+class TestSnapshot(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".nhls")
+        os.close(handle)
+
+        self.players = [
+            Player("Wayne Gretzky", "EDM", 35, 89),
+            Player("Jari Kurri", "EDM", 37, 53),
+            Player("Teemu Selänne", "ANA", 76, 56)
+        ]
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_pelaajat_sailyvat_tallennuksessa(self):
+        write_snapshot(self.path, self.players)
+
+        players = list(SnapshotReader(self.path).get_players())
+
+        self.assertEqual([str(player) for player in players], [str(player) for player in self.players])
+
+    def test_sarakkeet_luetaan_suoraan_tiedostosta(self):
+        write_snapshot(self.path, self.players)
+
+        with Snapshot(self.path) as snapshot:
+            self.assertEqual(len(snapshot), 3)
+            self.assertEqual(list(snapshot.columns["goals"]), [35, 37, 76])
+            self.assertEqual(snapshot.columns["team"][0], snapshot.columns["team"][1])
+            self.assertEqual(snapshot.string(snapshot.columns["team"][2]), "ANA")
+
+    def test_tyhja_tilannevedos(self):
+        write_snapshot(self.path, [])
+
+        self.assertEqual(list(SnapshotReader(self.path).get_players()), [])
+
+    def test_vaara_tiedostomuoto_aiheuttaa_virheen(self):
+        with open(self.path, "wb") as target:
+            target.write(b"not a snapshot at all")
+
+        with self.assertRaises(SnapshotError):
+            Snapshot(self.path)
+
+    def test_liian_lyhyt_tiedosto_aiheuttaa_virheen(self):
+        with self.assertRaises(SnapshotError):
+            Snapshot(self.path)
+
+    def test_katkennut_tiedosto_aiheuttaa_virheen(self):
+        write_snapshot(self.path, self.players)
+
+        with open(self.path, "r+b") as target:
+            target.truncate(os.path.getsize(self.path) - 16)
+
+        with self.assertRaises(SnapshotError):
+            Snapshot(self.path)
@@ -0,0 +1,68 @@
+import asyncio
+import requests
+from requests.adapters import HTTPAdapter
+from player import player_from_dict
+from json_stream import iter_array
+
+SEASONS = ("2018-19", "2019-20", "2020-21", "2021-22", "2022-23", "2023-24", "2024-25", "2025-26")
+SEASON_URL = "https://studies.cs.helsinki.fi/nhlstats/{season}/players"
+CHUNK_SIZE = 64 * 1024
+
+
+def is_retryable(error):
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return True
+
+    response = getattr(error, "response", None)
+
+    return response is not None and (response.status_code >= 500 or response.status_code == 429)
+
+
+class AsyncPlayerReader:
+    def __init__(self, urls, max_concurrency=4, timeout=10, retries=3, backoff=0.5):
+        self._urls = list(urls)
+        self._max_concurrency = max_concurrency
+        self._timeout = timeout
+        self._retries = retries
+        self._backoff = backoff
+        self._session = requests.Session()
+
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @staticmethod
+    def for_seasons(seasons=SEASONS, **options):
+        return AsyncPlayerReader([SEASON_URL.format(season=season) for season in seasons], **options)
+
+    async def fetch_all(self):
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        results = await asyncio.gather(*(self._fetch(url, semaphore) for url in self._urls))
+
+        return dict(zip(self._urls, results))
+
+    async def _fetch(self, url, semaphore):
+        async with semaphore:
+            for attempt in range(self._retries):
+                try:
+                    return await asyncio.to_thread(self._get, url)
+                except requests.RequestException as error:
+                    if not is_retryable(error):
+                        raise
+
+                await asyncio.sleep(self._backoff * 2 ** attempt)
+
+            return await asyncio.to_thread(self._get, url)
+
+    def _get(self, url):
+        with self._session.get(url, timeout=self._timeout, stream=True) as response:
+            response.raise_for_status()
+            return [player_from_dict(player_dict) for player_dict in iter_array(response.iter_content(chunk_size=CHUNK_SIZE))]
+
+    def get_players(self):
+        players_by_url = asyncio.run(self.fetch_all())
+
+        return [player for url in self._urls for player in players_by_url[url]]
+
+    def close(self):
+        self._session.close()
@@ -0,0 +1,57 @@
+import json
+import sys
+import tracemalloc
+from player import player_from_dict
+from json_stream import iter_array
+
+CHUNK_SIZE = 64 * 1024
+
+
+def synthetic_body(how_many):
+    players = [
+        {
+            "name": f"Player {i}",
+            "nationality": "FIN",
+            "assists": i % 70,
+            "goals": i % 50,
+            "team": "EDM",
+            "games": 82,
+            "id": i,
+            "penalties": 10,
+            "plus_minus": 5
+        }
+        for i in range(how_many)
+    ]
+
+    return json.dumps(players).encode("utf-8")
+
+
+def whole_body(body):
+    return [player_from_dict(player_dict) for player_dict in json.loads(body)]
+
+
+def streamed(body):
+    chunks = (body[start:start + CHUNK_SIZE] for start in range(0, len(body), CHUNK_SIZE))
+
+    return [player_from_dict(player_dict) for player_dict in iter_array(chunks)]
+
+
+def peak_memory(function, body):
+    tracemalloc.start()
+    players = function(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return len(players), peak
+
+
+def main(how_many):
+    body = synthetic_body(how_many)
+
+    for name, function in (("json.loads", whole_body), ("streamed", streamed)):
+        players, peak = peak_memory(function, body)
+        print(f"{name:12} {players} players, peak {peak / 1024 / 1024:.1f} MiB")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
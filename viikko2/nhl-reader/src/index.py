@@ -1,31 +1,46 @@
+import argparse
+import sys
 from rich.console import Console
-from rich.table import Table
 from player_reader import PlayerReader
+from feed_cache import FeedCache
 from player_stats import PlayerStats
+from renderer import render_table, write_csv, write_ndjson
+
+SEASONS = "2018-19/2019-20/2020-21/2021-22/2022-23/2023-24/2024-25/2025-26"
+NATIONALITIES = "USA/FIN/CAN/SWE/CZE/RUS/SLO/FRA/GBR/SVK/DEN/NED/AUT/BLR/GER/SUI/NOR/UZB/LAT/AUS"
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="NHL players by nationality")
+    parser.add_argument("--season")
+    parser.add_argument("--nationality")
+    parser.add_argument("--format", choices=("table", "csv", "ndjson"),
+                        help="output format, csv when output is not a terminal")
+
+    return parser.parse_args()
+
 
 def main():
+    arguments = parse_arguments()
     console = Console()
-    season = console.input("Season [magenta][2018-19/2019-20/2020-21/2021-22/2022-23/2023-24/2024-25/2025-26][/] ")
-    nationality = console.input("Nationality [magenta][USA/FIN/CAN/SWE/CZE/RUS/SLO/FRA/GBR/SVK/DEN/NED/AUT/BLR/GER/SUI/NOR/UZB/LAT/AUS][/]")
+    # kehotteet kirjoitetaan stderriin, jotta ne eivät sekoitu putkitettuun CSV- tai NDJSON-tulosteeseen
+    prompts = Console(stderr=True)
+    season = arguments.season or prompts.input(f"Season [magenta][{SEASONS}][/] ")
+    nationality = arguments.nationality or prompts.input(f"Nationality [magenta][{NATIONALITIES}][/]")
+    output_format = arguments.format or ("table" if console.is_terminal else "csv")
 
     url = f"https://studies.cs.helsinki.fi/nhlstats/{season}/players"
-    reader = PlayerReader(url)
+    reader = PlayerReader(url, FeedCache())
     stats = PlayerStats(reader)
 
     players = stats.top_scorers_by_nationality(nationality)
 
-    table = Table(title=f"Season {season} players from {nationality}")
-
-    table.add_column("Released", style="blue")
-    table.add_column("teams", style="purple")
-    table.add_column("goals", style="green")
-    table.add_column("assists", style="green")
-    table.add_column("points", style="green")
-
-    for player in players:
-        table.add_row(str(player.name), str(player.team), str(player.goals), str(player.assists), str(player.points))
-
-    console.print(table)
+    if output_format == "csv":
+        write_csv(players, sys.stdout)
+    elif output_format == "ndjson":
+        write_ndjson(players, sys.stdout)
+    else:
+        render_table(console, players, f"Season {season} players from {nationality}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,87 @@
+import codecs
+import json
+
+PLAYER_FIELDS = frozenset(("name", "nationality", "team", "goals", "assists"))
+WHITESPACE = " \t\n\r"
+NUMBER_CHARACTERS = "0123456789.eE+-"
+
+
+def only_player_fields(pairs):
+    return {key: value for key, value in pairs if key in PLAYER_FIELDS}
+
+
+class ArrayStream:
+    def __init__(self, chunks, object_pairs_hook=only_player_fields):
+        self._chunks = iter(chunks)
+        self._decoder = json.JSONDecoder(object_pairs_hook=object_pairs_hook)
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._position = 0
+
+    def __iter__(self):
+        self._expect("[")
+
+        if self._peek() == "]":
+            return
+
+        while True:
+            yield self._next_value()
+
+            if self._peek() == "]":
+                return
+
+            self._expect(",")
+
+    def _next_value(self):
+        self._peek()
+
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._read_more():
+                    raise
+                continue
+
+            if self._is_complete(value, end) or not self._read_more():
+                self._position = end
+                return value
+
+    def _is_complete(self, value, end):
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return True
+
+        # luku voi jatkua seuraavassa palassa, joten sen perässä on oltava jokin muu merkki
+        return end < len(self._buffer) and self._buffer[end] not in NUMBER_CHARACTERS
+
+    def _read_more(self):
+        chunk = next(self._chunks, None)
+
+        if chunk is None:
+            return False
+
+        # luetut alkiot poistetaan puskurista, jotta muistinkäyttö pysyy tasaisena
+        self._buffer = self._buffer[self._position:] + self._text_decoder.decode(chunk)
+        self._position = 0
+
+        return True
+
+    def _peek(self):
+        while True:
+            while self._position < len(self._buffer) and self._buffer[self._position] in WHITESPACE:
+                self._position += 1
+
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._read_more():
+                raise ValueError("Unexpected end of JSON array")
+
+    def _expect(self, character):
+        if self._peek() != character:
+            raise ValueError(f"Expected {character!r} at JSON position {self._position}")
+
+        self._position += 1
+
+
+def iter_array(chunks, object_pairs_hook=only_player_fields):
+    return iter(ArrayStream(chunks, object_pairs_hook))
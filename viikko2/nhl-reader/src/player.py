@@ -1,11 +1,48 @@
+import sys
+
+
 class Player:
-    def __init__(self, dict):
-        self.name = dict['name']
-        self.nationality = dict['nationality']
-        self.team = dict['team']
-        self.goals = dict['goals']
-        self.assists = dict['assists']
-        self.points = self.goals + self.assists
-        
+    __slots__ = ("name", "team", "nationality", "_goals", "_assists", "_points")
+
+    def __init__(self, name, team, goals, assists, nationality=None):
+        self.name = name
+        self.team = sys.intern(team)
+        self.nationality = sys.intern(nationality) if nationality else nationality
+        self._goals = goals
+        self._assists = assists
+        self._points = goals + assists
+
+    @property
+    def goals(self):
+        return self._goals
+
+    @goals.setter
+    def goals(self, goals):
+        self._goals = goals
+        self._points = goals + self._assists
+
+    @property
+    def assists(self):
+        return self._assists
+
+    @assists.setter
+    def assists(self, assists):
+        self._assists = assists
+        self._points = self._goals + assists
+
+    @property
+    def points(self):
+        return self._points
+
     def __str__(self):
         return f"{self.name:20} {self.team:15} {self.goals} + {self.assists} = {self.points}"
+
+
+def player_from_dict(player_dict):
+    return Player(
+        player_dict["name"],
+        player_dict["team"],
+        player_dict["goals"],
+        player_dict["assists"],
+        player_dict["nationality"]
+    )
@@ -1,18 +1,23 @@
 import requests
-from player import Player
+from player import player_from_dict
+from json_stream import iter_array
+
+CHUNK_SIZE = 64 * 1024
 
 class PlayerReader:
-    def __init__(self, url):
+    def __init__(self, url, cache=None, session=None, timeout=10):
         self._url = url
+        self._cache = cache
+        self._session = session or requests
+        self._timeout = timeout
 
     def get_players(self):
-        response = requests.get(self._url).json()
-
-        players = []
-
-        for player_dict in response:
-            player = Player(player_dict)
-            players.append(player)
+        return [player_from_dict(player_dict) for player_dict in iter_array(self._chunks())]
 
-        return players
-    
\ No newline at end of file
+    def _chunks(self):
+        if self._cache is None:
+            with self._session.get(self._url, timeout=self._timeout, stream=True) as response:
+                yield from response.iter_content(chunk_size=CHUNK_SIZE)
+        else:
+            with self._cache.open(self._url) as feed:
+                yield from iter(lambda: feed.read(CHUNK_SIZE), b"")
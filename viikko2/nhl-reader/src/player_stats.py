@@ -1,16 +1,70 @@
+from heapq import merge
+from itertools import islice
+
+
+def points_of(player):
+    return player.points
+
+
+def page_of(players, page, page_size):
+    start = page * page_size
+
+    return players[start:start + page_size]
+
+
 class PlayerStats:
     def __init__(self, player_reader):
         reader = player_reader
 
         self._players = reader.get_players()
+        self._by_nationality = {}
 
-    def top_scorers_by_nationality(self, nationality):
-        players_by_nationality = []
         for player in self._players:
-            if player.nationality == nationality:
-                players_by_nationality.append(player)
+            self._by_nationality.setdefault(player.nationality, []).append(player)
+
+        # jokainen kansallisuus järjestetään pisteiden mukaan vain kerran
+        for players in self._by_nationality.values():
+            players.sort(key=points_of, reverse=True)
+
+    def nationalities(self):
+        return list(self._by_nationality)
+
+    def ranking(self, nationality):
+        return self._by_nationality.get(nationality, [])
+
+    def top_scorers_by_nationality(self, nationality, how_many=None):
+        return self.ranking(nationality)[:how_many]
+
+    def page_by_nationality(self, nationality, page, page_size=20):
+        return page_of(self.ranking(nationality), page, page_size)
+
+
+class MultiSeasonStats:
+    def __init__(self, season_stats):
+        self._season_stats = list(season_stats)
+        self._merged = {}
+
+    def ranking(self, nationality):
+        if nationality not in self._merged:
+            # kausien valmiit järjestykset yhdistetään järjestämättä uudelleen
+            self._merged[nationality] = list(merge(
+                *(stats.ranking(nationality) for stats in self._season_stats),
+                key=points_of,
+                reverse=True
+            ))
+
+        return self._merged[nationality]
+
+    def iter_by_nationality(self, nationality, how_many=None):
+        rankings = (stats.ranking(nationality) for stats in self._season_stats)
+
+        return islice(merge(*rankings, key=points_of, reverse=True), how_many)
+
+    def top_scorers_by_nationality(self, nationality, how_many=None):
+        if how_many is not None and nationality not in self._merged:
+            return list(self.iter_by_nationality(nationality, how_many))
 
-        players_by_nationality.sort(key=lambda player: player.points, reverse=True)
+        return self.ranking(nationality)[:how_many]
 
-        return players_by_nationality
-    
\ No newline at end of file
+    def page_by_nationality(self, nationality, page, page_size=20):
+        return page_of(self.ranking(nationality), page, page_size)
@@ -0,0 +1,63 @@
+import csv
+import json
+from itertools import islice
+from rich.table import Table
+
+FIELDS = ("name", "team", "goals", "assists", "points")
+TABLE_COLUMNS = (
+    ("Released", "blue", 25),
+    ("teams", "purple", 15),
+    ("goals", "green", 5),
+    ("assists", "green", 7),
+    ("points", "green", 6)
+)
+PAGE_SIZE = 50
+
+
+def batches(players, size=PAGE_SIZE):
+    players = iter(players)
+
+    while True:
+        batch = list(islice(players, size))
+
+        if not batch:
+            return
+
+        yield batch
+
+
+def format_rows(batch):
+    return [
+        (player.name, player.team, str(player.goals), str(player.assists), str(player.points))
+        for player in batch
+    ]
+
+
+def render_table(console, players, title, page_size=PAGE_SIZE):
+    # jokainen sivu tulostetaan heti, joten tulostus alkaa ennen kuin kaikki rivit on käsitelty
+    for page, batch in enumerate(batches(players, page_size)):
+        table = Table(title=title if page == 0 else None, show_header=page == 0)
+
+        for header, style, width in TABLE_COLUMNS:
+            table.add_column(header, style=style, width=width)
+
+        for row in format_rows(batch):
+            table.add_row(*row)
+
+        console.print(table)
+
+
+def write_csv(players, output, page_size=PAGE_SIZE):
+    writer = csv.writer(output)
+    writer.writerow(FIELDS)
+
+    for batch in batches(players, page_size):
+        writer.writerows(format_rows(batch))
+
+
+def write_ndjson(players, output, page_size=PAGE_SIZE):
+    for batch in batches(players, page_size):
+        output.write("".join(
+            json.dumps({field: getattr(player, field) for field in FIELDS}) + "\n"
+            for player in batch
+        ))
@@ -0,0 +1,87 @@
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import requests
+from async_player_reader import AsyncPlayerReader
+
+
+class SeasonHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    hits = {}
+
+    def do_GET(self):
+        SeasonHandler.hits[self.path] = SeasonHandler.hits.get(self.path, 0) + 1
+        status = 200
+
+        # /flaky/<tila>: kaksi ensimmäistä pyyntöä epäonnistuvat annetulla tilakoodilla
+        if self.path.startswith("/flaky/") and SeasonHandler.hits[self.path] < 3:
+            status = int(self.path.split("/")[2])
+        elif self.path == "/missing":
+            status = 404
+        elif self.path.startswith("/delay/"):
+            time.sleep(float(self.path.split("/")[2]))
+
+        body = json.dumps([{
+            "name": self.path, "nationality": "FIN", "team": "EDM", "goals": 1, "assists": 2
+        }]).encode("utf-8") if status == 200 else b""
+
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAsyncPlayerReader(unittest.TestCase):
+    def setUp(self):
+        SeasonHandler.hits = {}
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), SeasonHandler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_port}"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def reader(self, *paths, **options):
+        reader = AsyncPlayerReader([self.base_url + path for path in paths], backoff=0, **options)
+        self.addCleanup(reader.close)
+
+        return reader
+
+    def test_palvelinvirhe_yritetaan_uudelleen(self):
+        players = self.reader("/flaky/503").get_players()
+
+        self.assertEqual([player.name for player in players], ["/flaky/503"])
+        self.assertEqual(SeasonHandler.hits["/flaky/503"], 3)
+
+    def test_liian_monta_pyyntoa_yritetaan_uudelleen(self):
+        players = self.reader("/flaky/429").get_players()
+
+        self.assertEqual(len(players), 1)
+        self.assertEqual(SeasonHandler.hits["/flaky/429"], 3)
+
+    def test_puuttuvaa_kautta_ei_yriteta_uudelleen(self):
+        with self.assertRaises(requests.HTTPError):
+            self.reader("/missing").get_players()
+
+        self.assertEqual(SeasonHandler.hits["/missing"], 1)
+
+    def test_pyynnon_aikakatkaisu(self):
+        started = time.perf_counter()
+
+        with self.assertRaises(requests.Timeout):
+            self.reader("/delay/1", timeout=0.1, retries=0).get_players()
+
+        self.assertLess(time.perf_counter() - started, 0.9)
+
+    def test_pelaajat_palautetaan_osoitteiden_jarjestyksessa(self):
+        paths = ["/delay/0.3", "/delay/0.2", "/delay/0.1", "/delay/0"]
+
+        players = self.reader(*paths).get_players()
+
+        self.assertEqual([player.name for player in players], paths)
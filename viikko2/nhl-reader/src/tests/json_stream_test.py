@@ -0,0 +1,41 @@
+import json
+import unittest
+from json_stream import iter_array
+
+DOCUMENT = json.dumps([
+    1.5, -2e10, 3, 0.25e-3, True, None, "Selänne", 42,
+    {"name": "Teemu Selänne", "nationality": "FIN", "team": "ANA", "goals": 76, "assists": 56, "games": 84}
+], ensure_ascii=False).encode("utf-8")
+
+
+def split_at(data, position):
+    return [data[:position], data[position:]]
+
+
+class TestJsonStream(unittest.TestCase):
+    def test_taulukko_puretaan_jokaisesta_jakokohdasta(self):
+        expected = json.loads(DOCUMENT)
+        del expected[-1]["games"]
+
+        for position in range(len(DOCUMENT) + 1):
+            with self.subTest(position=position):
+                self.assertEqual(list(iter_array(split_at(DOCUMENT, position))), expected)
+
+    def test_luku_jaettuna_desimaalipisteen_kohdalta(self):
+        self.assertEqual(list(iter_array([b"[1.", b"5, 2]"])), [1.5, 2])
+        self.assertEqual(list(iter_array([b"[1e", b"3]"])), [1000.0])
+
+    def test_tavu_kerrallaan(self):
+        chunks = [DOCUMENT[i:i + 1] for i in range(len(DOCUMENT))]
+
+        self.assertEqual(len(list(iter_array(chunks))), 9)
+
+    def test_tyhja_taulukko(self):
+        self.assertEqual(list(iter_array([b" [ ", b"]"])), [])
+
+    def test_keskeneraisen_taulukon_virhe(self):
+        with self.assertRaises(ValueError):
+            list(iter_array([b"[1, 2"]))
+
+        with self.assertRaises(ValueError):
+            list(iter_array([b"[1."]))
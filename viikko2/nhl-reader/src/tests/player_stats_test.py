@@ -0,0 +1,89 @@
+import random
+import unittest
+from player import Player
+from player_stats import PlayerStats, MultiSeasonStats
+
+NATIONALITIES = ["FIN", "SWE", "CAN", "USA"]
+
+
+class PlayerReaderStub:
+    def __init__(self, players):
+        self._players = players
+
+    def get_players(self):
+        return self._players
+
+
+def generate_players(how_many, seed):
+    rng = random.Random(seed)
+
+    # pieni pistealue tuottaa paljon tasapisteitä
+    return [
+        Player(f"Player {seed}-{i}", "EDM", rng.randint(0, 5), rng.randint(0, 5), rng.choice(NATIONALITIES))
+        for i in range(how_many)
+    ]
+
+
+def scan_and_sort(players, nationality):
+    # aiempi toteutus vertailukohdaksi
+    players_by_nationality = [player for player in players if player.nationality == nationality]
+    players_by_nationality.sort(key=lambda player: player.points, reverse=True)
+
+    return players_by_nationality
+
+
+class TestPlayerStats(unittest.TestCase):
+    def setUp(self):
+        self.players = generate_players(300, seed=1)
+        self.stats = PlayerStats(PlayerReaderStub(self.players))
+
+    def test_jarjestys_vastaa_aiempaa_toteutusta(self):
+        for nationality in NATIONALITIES:
+            expected = scan_and_sort(self.players, nationality)
+
+            with self.subTest(nationality=nationality):
+                self.assertEqual(self.stats.top_scorers_by_nationality(nationality), expected)
+
+                for how_many in (0, 1, 10, len(expected), len(expected) + 5):
+                    self.assertEqual(self.stats.top_scorers_by_nationality(nationality, how_many), expected[:how_many])
+
+    def test_sivut_kattavat_koko_jarjestyksen(self):
+        expected = scan_and_sort(self.players, "FIN")
+        pages = [self.stats.page_by_nationality("FIN", page, 7) for page in range(len(expected) // 7 + 2)]
+
+        self.assertTrue(all(len(page) == 7 for page in pages[:len(expected) // 7]))
+        self.assertEqual([player for page in pages for player in page], expected)
+        self.assertEqual(pages[-1], [])
+
+    def test_tuntematon_kansallisuus(self):
+        self.assertEqual(self.stats.top_scorers_by_nationality("NOR"), [])
+        self.assertEqual(self.stats.top_scorers_by_nationality("NOR", 5), [])
+        self.assertEqual(self.stats.page_by_nationality("NOR", 0), [])
+
+
+class TestMultiSeasonStats(unittest.TestCase):
+    def setUp(self):
+        self.seasons = [generate_players(200, seed) for seed in range(3)]
+
+    def multi_season_stats(self):
+        return MultiSeasonStats(PlayerStats(PlayerReaderStub(players)) for players in self.seasons)
+
+    def test_laiska_yhdistaminen_vastaa_valimuistissa_olevaa(self):
+        for nationality in NATIONALITIES + ["NOR"]:
+            cached = self.multi_season_stats()
+            cached.ranking(nationality)
+            all_players = [player for players in self.seasons for player in players]
+
+            for how_many in (0, 1, 5, 50, 1000):
+                with self.subTest(nationality=nationality, how_many=how_many):
+                    lazy = self.multi_season_stats().top_scorers_by_nationality(nationality, how_many)
+
+                    self.assertEqual(lazy, cached.top_scorers_by_nationality(nationality, how_many))
+                    self.assertEqual(lazy, scan_and_sort(all_players, nationality)[:how_many])
+
+    def test_sivutus_yhdistetyssa_jarjestyksessa(self):
+        stats = self.multi_season_stats()
+        ranking = stats.ranking("SWE")
+
+        self.assertEqual(stats.page_by_nationality("SWE", 1, 10), ranking[10:20])
+        self.assertEqual(stats.page_by_nationality("NOR", 0), [])
@@ -0,0 +1,55 @@
+import csv
+import io
+import json
+import unittest
+from rich.console import Console
+from player import Player
+from renderer import FIELDS, batches, render_table, write_csv, write_ndjson
+
+
+def generate_players(how_many):
+    return [Player(f"Player {i}", f"T{i % 3}", i, i % 7, "FIN") for i in range(how_many)]
+
+
+class TestRenderer(unittest.TestCase):
+    def setUp(self):
+        # 11 pelaajaa ja sivun koko 4: viimeinen sivu jää vajaaksi
+        self.players = generate_players(11)
+
+    def test_erat_kattavat_kaikki_pelaajat(self):
+        sizes = [len(batch) for batch in batches(iter(self.players), 4)]
+
+        self.assertEqual(sizes, [4, 4, 3])
+        self.assertEqual(list(batches([], 4)), [])
+
+    def test_csv_otsikko_ja_rivit(self):
+        output = io.StringIO()
+        write_csv(iter(self.players), output, page_size=4)
+
+        rows = list(csv.reader(io.StringIO(output.getvalue())))
+
+        self.assertEqual(rows[0], list(FIELDS))
+        self.assertEqual([row[0] for row in rows[1:]], [player.name for player in self.players])
+        self.assertEqual(rows[3], ["Player 2", "T2", "2", "2", "4"])
+
+    def test_ndjson_kentat_ja_rivit(self):
+        output = io.StringIO()
+        write_ndjson(iter(self.players), output, page_size=4)
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+
+        self.assertEqual([record["name"] for record in records], [player.name for player in self.players])
+        self.assertTrue(all(set(record) == set(FIELDS) for record in records))
+        self.assertEqual(records[10], {"name": "Player 10", "team": "T1", "goals": 10, "assists": 3, "points": 13})
+
+    def test_taulukon_otsikko_vain_ensimmaisella_sivulla(self):
+        output = io.StringIO()
+        console = Console(file=output, width=120, color_system=None)
+        render_table(console, iter(self.players), "Players", page_size=4)
+
+        text = output.getvalue()
+
+        self.assertEqual(text.count("Released"), 1)
+        self.assertEqual(text.count("Players"), 1)
+        for player in self.players:
+            self.assertEqual(text.count(f"{player.name} "), 1)
@@ -0,0 +1,66 @@
+import argparse
+import json
+import sys
+import time
+from entities.user import User
+from repositories.user_repository import UserRepository
+from repositories.sqlite_user_repository import SqliteUserRepository
+from services.user_service import UserService
+
+PASSWORD = "salasana123"
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+
+    return sorted_values[index]
+
+
+def populate(repository, how_many):
+    for i in range(how_many):
+        repository.create(User(f"user{i}", PASSWORD))
+
+
+def measure_logins(service, how_many, logins):
+    latencies = []
+    step = max(1, how_many // logins)
+
+    # kirjaudutaan tasaisesti eri kohdista lisättyjä käyttäjiä
+    for i in range(0, how_many, step):
+        start = time.perf_counter()
+        service.check_credentials(f"user{i}", PASSWORD)
+        latencies.append(time.perf_counter() - start)
+
+    latencies.sort()
+
+    return {
+        "logins": len(latencies),
+        "p50_us": percentile(latencies, 0.50) * 1_000_000,
+        "p99_us": percentile(latencies, 0.99) * 1_000_000,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure login latency against the number of registered users")
+    parser.add_argument("--sizes", default="1000,10000,100000,1000000",
+                        help="comma separated registered user counts")
+    parser.add_argument("--logins", type=int, default=10000)
+    parser.add_argument("--database", help="measure SqliteUserRepository stored in this file")
+    arguments = parser.parse_args(argv)
+
+    for size in (int(size) for size in arguments.sizes.split(",")):
+        if arguments.database:
+            repository = SqliteUserRepository(arguments.database)
+            repository.delete_all()
+        else:
+            repository = UserRepository()
+
+        populate(repository, size)
+
+        record = {"users": size}
+        record.update(measure_logins(UserService(repository), size, arguments.logins))
+        print(json.dumps(record), flush=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
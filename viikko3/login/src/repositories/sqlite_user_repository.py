@@ -0,0 +1,86 @@
+import os
+import sqlite3
+import threading
+from entities.user import User
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id INTEGER PRIMARY KEY,
+    username TEXT NOT NULL,
+    password TEXT NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS users_username ON users (username);
+"""
+
+FIND_ALL = "SELECT id, username, password FROM users ORDER BY id"
+FIND_BY_USERNAME = "SELECT id, username, password FROM users WHERE username = ?"
+FIND_BY_ID = "SELECT id, username, password FROM users WHERE id = ?"
+INSERT = "INSERT INTO users (username, password) VALUES (?, ?)"
+INSERT_WITH_ID = "INSERT INTO users (id, username, password) VALUES (?, ?, ?)"
+DELETE = "DELETE FROM users WHERE id = ?"
+# ehdoton DELETE tyhjentää taulun kerralla rivi kerrallaan poistamisen sijaan
+DELETE_ALL = "DELETE FROM users"
+
+
+def user_from_row(row):
+    return User(row[1], row[2], row[0]) if row else None
+
+
+class SqliteUserRepository:
+    def __init__(self, path, timeout=5.0):
+        self._path = path
+        self._timeout = timeout
+        self._local = threading.local()
+
+        with self._connection() as connection:
+            connection.executescript(SCHEMA)
+
+    def _connection(self):
+        # jokaisella säikeellä ja prosessilla on oma yhteytensä, jota käytetään uudelleen
+        connection = getattr(self._local, "connection", None)
+
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self._path, timeout=self._timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+
+        return connection
+
+    def find_all(self):
+        return [user_from_row(row) for row in self._connection().execute(FIND_ALL)]
+
+    def find_by_username(self, username):
+        return user_from_row(self._connection().execute(FIND_BY_USERNAME, (username,)).fetchone())
+
+    def find_by_id(self, user_id):
+        return user_from_row(self._connection().execute(FIND_BY_ID, (user_id,)).fetchone())
+
+    def create(self, user):
+        try:
+            with self._connection() as connection:
+                if user.id is None:
+                    user.id = connection.execute(INSERT, (user.username, user.password)).lastrowid
+                else:
+                    connection.execute(INSERT_WITH_ID, (user.id, user.username, user.password))
+        except sqlite3.IntegrityError as error:
+            # id-sarakkeen pääavainrikko erotetaan käyttäjätunnuksen yksilöllisyysrikosta
+            if error.sqlite_errorcode == sqlite3.SQLITE_CONSTRAINT_PRIMARYKEY:
+                raise Exception(
+                    f"User with id {user.id} already exists"
+                ) from error
+
+            raise Exception(
+                f"User with username {user.username} already exists"
+            ) from error
+
+        return user
+
+    def delete(self, user_id):
+        with self._connection() as connection:
+            connection.execute(DELETE, (user_id,))
+
+    def delete_all(self):
+        with self._connection() as connection:
+            connection.execute(DELETE_ALL)
@@ -1,50 +1,58 @@
+import os
 from entities.user import User
+from repositories.sqlite_user_repository import SqliteUserRepository
 
 
 class UserRepository:
     def __init__(self):
-        self._users = []
+        # käyttäjät haetaan sanakirjoista suoraan käyttäjätunnuksen tai id:n perusteella
+        self._users = {}
+        self._users_by_id = {}
+        self._next_id = 1
 
     def find_all(self):
-        return self._users
+        return list(self._users.values())
 
     def find_by_username(self, username):
-        users = self.find_all()
+        return self._users.get(username)
 
-        users_with_username = filter(
-            lambda user: user.username == username,
-            users
-        )
-
-        users_with_username_list = list(users_with_username)
-
-        return users_with_username_list[0] if len(users_with_username_list) > 0 else None
+    def find_by_id(self, user_id):
+        return self._users_by_id.get(user_id)
 
     def create(self, user):
-        users = self.find_all()
-
-        existing_user = self.find_by_username(user.username)
-
-        if existing_user:
+        if user.username in self._users:
             raise Exception(
                 f"User with username {user.username} already exists"
             )
 
-        users.append(user)
+        if user.id in self._users_by_id:
+            raise Exception(
+                f"User with id {user.id} already exists"
+            )
+
+        if user.id is None:
+            user.id = self._next_id
 
-        self._users = users
+        self._next_id = max(self._next_id, user.id + 1)
+
+        self._users[user.username] = user
+        self._users_by_id[user.id] = user
 
         return user
 
     def delete(self, user_id):
-        users = self.find_all()
-
-        users_without_id = filter(lambda user: user.id != user_id, users)
+        user = self._users_by_id.pop(user_id, None)
 
-        self._users = list(users_without_id)
+        if user:
+            del self._users[user.username]
 
     def delete_all(self):
-        self._users = []
+        self._users = {}
+        self._users_by_id = {}
 
 
-user_repository = UserRepository()
+# USER_DATABASE-ympäristömuuttuja valitsee pysyvän SQLite-tietokannan muistissa pidettävien käyttäjien sijaan
+if os.getenv("USER_DATABASE"):
+    user_repository = SqliteUserRepository(os.getenv("USER_DATABASE"))
+else:
+    user_repository = UserRepository()
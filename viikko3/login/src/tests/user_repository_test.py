@@ -0,0 +1,91 @@
+import importlib
+import os
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from entities.user import User
+from repositories import user_repository as user_repository_module
+from repositories.sqlite_user_repository import SqliteUserRepository
+from repositories.user_repository import UserRepository
+
+
+class RepositoryTests:
+    def test_kayttaja_loytyy_tunnuksella_ja_idlla(self):
+        user = self.repository.create(User("kalle", "kalle123"))
+
+        self.assertEqual(self.repository.find_by_username("kalle").id, user.id)
+        self.assertEqual(self.repository.find_by_id(user.id).username, "kalle")
+        self.assertIsNone(self.repository.find_by_username("pekka"))
+
+    def test_sama_kayttajatunnus_hylataan(self):
+        self.repository.create(User("kalle", "kalle123"))
+
+        with self.assertRaisesRegex(Exception, "username kalle already exists"):
+            self.repository.create(User("kalle", "toinen123"))
+
+        self.assertEqual(len(self.repository.find_all()), 1)
+
+    def test_sama_id_hylataan_omalla_virheella(self):
+        self.repository.create(User("kalle", "kalle123", 7))
+
+        with self.assertRaisesRegex(Exception, "id 7 already exists"):
+            self.repository.create(User("pekka", "pekka123", 7))
+
+        self.assertIsNone(self.repository.find_by_username("pekka"))
+
+    def test_poisto(self):
+        kalle = self.repository.create(User("kalle", "kalle123"))
+        self.repository.create(User("pekka", "pekka123"))
+
+        self.repository.delete(kalle.id)
+
+        self.assertEqual([user.username for user in self.repository.find_all()], ["pekka"])
+        self.assertIsNone(self.repository.find_by_id(kalle.id))
+
+        self.repository.delete_all()
+
+        self.assertEqual(self.repository.find_all(), [])
+        self.repository.create(User("kalle", "kalle123"))
+
+
+class TestUserRepository(RepositoryTests, unittest.TestCase):
+    def setUp(self):
+        self.repository = UserRepository()
+
+
+class TestSqliteUserRepository(RepositoryTests, unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "users.db")
+
+        # USER_DATABASE valitsee SQLite-toteutuksen samoin kuin sovellusta käynnistettäessä
+        with mock.patch.dict(os.environ, {"USER_DATABASE": self.path}):
+            self.repository = importlib.reload(user_repository_module).user_repository
+
+    def tearDown(self):
+        importlib.reload(user_repository_module)
+        self.directory.cleanup()
+
+    def test_ymparistomuuttuja_valitsee_sqliten(self):
+        self.assertIsInstance(self.repository, SqliteUserRepository)
+        self.repository.create(User("kalle", "kalle123"))
+
+        self.assertEqual(SqliteUserRepository(self.path).find_by_username("kalle").password, "kalle123")
+
+    def test_saikeilla_on_omat_yhteydet(self):
+        connections = {}
+
+        def create(i):
+            connections[i] = self.repository._connection()
+            self.repository.create(User(f"user{i}", "salasana123"))
+
+        threads = [threading.Thread(target=create, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(connection) for connection in connections.values()}), 4)
+        self.assertNotIn(self.repository._connection(), connections.values())
+        self.assertEqual(sorted(user.username for user in self.repository.find_all()), [f"user{i}" for i in range(4)])
@@ -0,0 +1,162 @@
+import argparse
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from player import Player
+from statistics import Statistics
+from matchers import QueryBuilder, And, Or, Not, PlaysIn, HasAtLeast, HasFewerThan
+
+TEAMS = ["PHI", "EDM", "NYR", "BOS", "COL", "FLA", "DET", "PIT", "TOR", "MTL"]
+
+
+def generate_players(how_many, seed=1):
+    rng = random.Random(seed)
+
+    return [
+        Player(f"Player {i}", rng.choice(TEAMS), rng.randint(0, 50), rng.randint(0, 70))
+        for i in range(how_many)
+    ]
+
+
+class SyntheticReader:
+    def __init__(self, how_many, seed=1):
+        self._players = generate_players(how_many, seed)
+
+    def get_players(self):
+        return self._players
+
+
+def query_corpus():
+    query = QueryBuilder()
+
+    deep_and = query
+    for value in range(1, 11):
+        deep_and = deep_and.has_at_least(value, "points")
+
+    return {
+        "dashboard": query.one_of(
+            query.plays_in("PHI").has_at_least(10, "assists").has_fewer_than(10, "goals"),
+            query.plays_in("EDM").has_at_least(50, "points"),
+        ).build(),
+        "deep_and": deep_and.plays_in("BOS").has_fewer_than(40, "goals").build(),
+        "wide_one_of": query.one_of(
+            *(query.plays_in(team).has_at_least(40, "goals") for team in TEAMS)
+        ).build(),
+        "not": And(Not(HasAtLeast(5, "goals")), Not(PlaysIn("NYR"))),
+        "not_or": Not(Or(HasAtLeast(30, "goals"), HasFewerThan(20, "assists"), PlaysIn("TOR"))),
+        "selective": query.plays_in("COL").has_at_least(48, "goals").build(),
+    }
+
+
+def operations(stats, baseline_players):
+    result = {
+        "team": lambda: stats.team("PHI"),
+        "search": lambda: stats.search("Player 4242"),
+        "top_scorers": lambda: stats.top_scorers(10),
+    }
+
+    for name, matcher in query_corpus().items():
+        result[f"matches:{name}"] = lambda matcher=matcher: stats.matches(matcher)
+        result[f"per_object:{name}"] = lambda matcher=matcher: [
+            player for player in baseline_players if matcher.test(player)
+        ]
+
+    return result
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+
+    return sorted_values[index]
+
+
+def measure(function, min_runs, min_seconds):
+    latencies = []
+    started = time.perf_counter()
+
+    while len(latencies) < min_runs or time.perf_counter() - started < min_seconds:
+        start = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    latencies.sort()
+
+    return {
+        "runs": len(latencies),
+        "throughput": len(latencies) / sum(latencies),
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "peak_bytes": peak,
+    }
+
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(description="Benchmark query-language Statistics")
+    parser.add_argument("--sizes", default="1000,10000,100000",
+                        help="comma separated player counts, e.g. 1000,100000,10000000")
+    parser.add_argument("--cache-size", type=int, default=0,
+                        help="Statistics result cache size, 0 measures uncached evaluation")
+    parser.add_argument("--min-runs", type=int, default=5)
+    parser.add_argument("--min-seconds", type=float, default=0.5)
+    parser.add_argument("--skip-per-object", action="store_true",
+                        help="skip the matcher.test() baseline")
+    parser.add_argument("--scaling", action="store_true",
+                        help="measure unindexed matches with 1..cpu_count worker processes")
+
+    return parser.parse_args(argv)
+
+
+def worker_counts():
+    counts = [1]
+
+    while counts[-1] * 2 <= os.cpu_count():
+        counts.append(counts[-1] * 2)
+
+    return counts
+
+
+def scaling(arguments):
+    for size in (int(size) for size in arguments.sizes.split(",")):
+        reader = SyntheticReader(size)
+
+        for workers in worker_counts():
+            stats = Statistics(reader, indexed=False, cache_size=0, workers=workers, parallel_threshold=0)
+
+            for name, matcher in query_corpus().items():
+                record = {"size": size, "workers": workers, "operation": f"matches:{name}"}
+                record.update(measure(lambda: stats.matches(matcher), arguments.min_runs, arguments.min_seconds))
+                print(json.dumps(record), flush=True)
+
+            stats.close()
+
+
+def main(argv=None):
+    arguments = parse_arguments(argv)
+
+    if arguments.scaling:
+        scaling(arguments)
+        return
+
+    for size in (int(size) for size in arguments.sizes.split(",")):
+        reader = SyntheticReader(size)
+        stats = Statistics(reader, cache_size=arguments.cache_size)
+
+        for name, function in operations(stats, reader.get_players()).items():
+            if arguments.skip_per_object and name.startswith("per_object:"):
+                continue
+
+            record = {"size": size, "operation": name}
+            record.update(measure(function, arguments.min_runs, arguments.min_seconds))
+            print(json.dumps(record), flush=True)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
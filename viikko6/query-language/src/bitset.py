@@ -0,0 +1,35 @@
+from itertools import compress, count
+
+MASK_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+DIGIT_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
+
+
+def full(size):
+    return (1 << size) - 1
+
+
+def contains(bits, row):
+    return bits >> row & 1 == 1
+
+
+def from_rows(rows, size):
+    data = bytearray((size + 7) // 8)
+
+    for row in rows:
+        data[row >> 3] |= 1 << (row & 7)
+
+    return int.from_bytes(data, "little")
+
+
+def from_mask(mask):
+    if not mask:
+        return 0
+
+    # maski muutetaan binäärimerkkijonoksi, jonka int() jäsentää yhdellä C-tason läpikäynnillä
+    return int(bytes(mask)[::-1].translate(MASK_DIGITS), 2)
+
+
+def rows(bits):
+    digits = format(bits, "b")[::-1].encode("ascii").translate(DIGIT_FLAGS)
+
+    return compress(count(), digits)
@@ -0,0 +1,29 @@
+from matchers import COLUMNS
+
+
+class CompiledMatcher:
+    def __init__(self, matcher, table):
+        names = ", ".join(COLUMNS)
+        expression = matcher.expression(table)
+        row_values = ", ".join(f"columns[{i}][row]" for i in range(len(COLUMNS)))
+
+        self.source = f"lambda columns: [{expression} for {names} in zip(*columns)]"
+        self._mask = eval(compile(self.source, "<matcher>", "eval"), {})
+        self._iter_rows = eval(compile(
+            f"lambda columns, rows: (row for row in rows for {names} in (({row_values}),) if {expression})",
+            "<matcher>",
+            "eval"
+        ), {})
+
+    def mask(self, table):
+        return self._mask(table.columns())
+
+    def iter_rows(self, table, rows):
+        return self._iter_rows(table.columns(), rows)
+
+    def filter(self, table, rows):
+        return list(self.iter_rows(table, rows))
+
+
+def compile_matcher(matcher, table):
+    return CompiledMatcher(matcher, table)
@@ -1,11 +1,12 @@
 from statistics import Statistics
 from player_reader import PlayerReader
+from feed_cache import FeedCache
 from matchers import And, HasAtLeast, PlaysIn, Not, HasFewerThan, All, Or, QueryBuilder
 
 
 def main():
     url = "https://studies.cs.helsinki.fi/nhlstats/2024-25/players.txt"
-    reader = PlayerReader(url)
+    reader = PlayerReader(url, FeedCache())
     stats = Statistics(reader)
 
     # matcher = And(Not(HasAtLeast(2, "goals")), PlaysIn("NYR"))
@@ -29,6 +30,11 @@ def main():
     for player in stats.matches(matcher):
         print(player)
 
+    print()
+
+    for player in stats.query("team=PHI and assists>=10 and goals<10 or (team=EDM and points>=50)"):
+        print(player)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,107 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from matchers import And, PlaysIn, HasAtLeast, HasFewerThan
+
+INDEXED_COLUMNS = ("goals", "assists", "points")
+
+
+class TableIndex:
+    def __init__(self, table):
+        self._table = table
+        self._team_rows = {}
+        self._sorted = {}
+
+        for row, code in enumerate(table.team):
+            self._team_rows.setdefault(code, array("I")).append(row)
+
+        for column in INDEXED_COLUMNS:
+            values = getattr(table, column)
+            rows = array("I", sorted(range(len(table)), key=values.__getitem__))
+            self._sorted[column] = (array("i", (values[row] for row in rows)), rows)
+
+    def __len__(self):
+        return len(self._table)
+
+    def is_indexed(self, leaf):
+        if isinstance(leaf, PlaysIn):
+            return True
+
+        return isinstance(leaf, (HasAtLeast, HasFewerThan)) and leaf.attr in self._sorted
+
+    def team_rows(self, team):
+        return self._team_rows.get(self._table.team_code(team), array("I"))
+
+    def at_least(self, attr, value):
+        values, rows = self._sorted[attr]
+
+        return rows[bisect_left(values, value):]
+
+    def fewer_than(self, attr, value):
+        values, rows = self._sorted[attr]
+
+        return rows[:bisect_left(values, value)]
+
+    def count(self, leaf):
+        if isinstance(leaf, PlaysIn):
+            return len(self.team_rows(leaf.team))
+
+        values, _ = self._sorted[leaf.attr]
+        split = bisect_left(values, leaf.value)
+
+        if isinstance(leaf, HasAtLeast):
+            return len(values) - split
+
+        return split
+
+    def _rows(self, leaf):
+        if isinstance(leaf, PlaysIn):
+            return self.team_rows(leaf.team)
+
+        if isinstance(leaf, HasAtLeast):
+            rows = self.at_least(leaf.attr, leaf.value)
+        else:
+            rows = self.fewer_than(leaf.attr, leaf.value)
+
+        return sorted(rows)
+
+    def update(self, row, old_values, new_values):
+        for column in INDEXED_COLUMNS:
+            old_value = old_values[column]
+            new_value = new_values[column]
+
+            if old_value != new_value:
+                values, rows = self._sorted[column]
+
+                position = self._position(values, rows, old_value, row)
+                del values[position]
+                del rows[position]
+
+                position = self._position(values, rows, new_value, row)
+                values.insert(position, new_value)
+                rows.insert(position, row)
+
+    def _position(self, values, rows, value, row):
+        low = bisect_left(values, value)
+        high = bisect_right(values, value, low)
+
+        return bisect_left(rows, row, low, high)
+
+    def _indexed_leaves(self, matcher):
+        if isinstance(matcher, And):
+            for child in matcher.matchers:
+                yield from self._indexed_leaves(child)
+        elif self.is_indexed(matcher):
+            yield matcher
+
+    def candidates(self, matcher, max_rows=None):
+        leaves = list(self._indexed_leaves(matcher))
+
+        if not leaves:
+            return None
+
+        leaf = min(leaves, key=self.count)
+
+        if max_rows is not None and self.count(leaf) > max_rows:
+            return None
+
+        return self._rows(leaf)
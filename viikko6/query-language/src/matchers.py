@@ -1,7 +1,38 @@
-class And:
+COLUMNS = ("team", "goals", "assists", "points")
+
+
+def column_name(attr):
+    if attr not in COLUMNS:
+        raise ValueError(f"Unknown attribute: {attr}")
+
+    return attr
+
+
+class Matcher:
+    def key(self):
+        return (type(self).__name__,)
+
+    def __eq__(self, other):
+        return isinstance(other, Matcher) and self.key() == other.key()
+
+    def __hash__(self):
+        return hash(self.key())
+
+    def __repr__(self):
+        return repr(self.key())
+
+
+class And(Matcher):
     def __init__(self, *matchers):
         self._matchers = matchers
 
+    @property
+    def matchers(self):
+        return self._matchers
+
+    def key(self):
+        return (type(self).__name__, tuple(matcher.key() for matcher in self._matchers))
+
     def test(self, player):
         for matcher in self._matchers:
             if not matcher.test(player):
@@ -9,60 +40,142 @@ class And:
 
         return True
 
+    def expression(self, table):
+        if not self._matchers:
+            return "True"
+
+        return " and ".join(f"({matcher.expression(table)})" for matcher in self._matchers)
+
 
-class PlaysIn:
+class PlaysIn(Matcher):
     def __init__(self, team):
         self._team = team
 
+    @property
+    def team(self):
+        return self._team
+
+    def key(self):
+        return ("PlaysIn", self._team)
+
     def test(self, player):
         return player.team == self._team
 
+    def expression(self, table):
+        return f"team == {table.team_code(self._team)}"
 
-class HasAtLeast:
+
+class HasAtLeast(Matcher):
     def __init__(self, value, attr):
         self._value = value
         self._attr = attr
 
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def attr(self):
+        return self._attr
+
+    def key(self):
+        return (type(self).__name__, self._attr, self._value)
+
     def test(self, player):
         player_value = getattr(player, self._attr)
 
         return player_value >= self._value
 
+    def expression(self, table):
+        return f"{column_name(self._attr)} >= {self._value!r}"
+
 
-class HasFewerThan:
+class HasFewerThan(Matcher):
     def __init__(self, value, attr):
         self._value = value
         self._attr = attr
 
+    @property
+    def value(self):
+        return self._value
+
+    @property
+    def attr(self):
+        return self._attr
+
+    def key(self):
+        return (type(self).__name__, self._attr, self._value)
+
     def test(self, player):
         player_value = getattr(player, self._attr)
 
         return player_value < self._value
 
+    def expression(self, table):
+        return f"{column_name(self._attr)} < {self._value!r}"
 
-class Not:
+
+class Not(Matcher):
     def __init__(self, matcher):
         self._matcher = matcher
 
+    @property
+    def matcher(self):
+        return self._matcher
+
+    def key(self):
+        return ("Not", self._matcher.key())
+
     def test(self, player):
         if self._matcher.test(player):
             return False
 
         return True
 
+    def expression(self, table):
+        return f"not ({self._matcher.expression(table)})"
+
 
-class All:
+class All(Matcher):
     def __init__(self):
         pass
 
     def test(self, player):
         return True
 
+    def expression(self, table):
+        return "True"
+
+
+class InSeason(Matcher):
+    def __init__(self, *seasons):
+        self._seasons = seasons
+
+    @property
+    def seasons(self):
+        return self._seasons
 
-class Or:
+    def key(self):
+        return ("InSeason", tuple(sorted(self._seasons)))
+
+    def test(self, player):
+        return player.season in self._seasons
+
+    def expression(self, table):
+        return str(table.season in self._seasons)
+
+
+class Or(Matcher):
     def __init__(self, *matchers):
         self._matchers = matchers
 
+    @property
+    def matchers(self):
+        return self._matchers
+
+    def key(self):
+        return (type(self).__name__, tuple(matcher.key() for matcher in self._matchers))
+
     def test(self, player):
         for matcher in self._matchers:
             if matcher.test(player):
@@ -70,6 +183,12 @@ class Or:
 
         return False
 
+    def expression(self, table):
+        if not self._matchers:
+            return "False"
+
+        return " or ".join(f"({matcher.expression(table)})" for matcher in self._matchers)
+
 
 class QueryBuilder:
     def __init__(self, matcher=None):
@@ -87,6 +206,9 @@ class QueryBuilder:
     def has_fewer_than(self, value, attr):
         return QueryBuilder(And(self._matcher, HasFewerThan(value, attr)))
 
+    def in_season(self, *seasons):
+        return QueryBuilder(And(self._matcher, InSeason(*seasons)))
+
     def one_of(self, *queries):
         matchers = []
         for query in queries:
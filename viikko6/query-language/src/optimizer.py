@@ -0,0 +1,150 @@
+from matchers import And, Or, Not, All, PlaysIn, HasAtLeast, HasFewerThan, InSeason
+
+DEFAULT_TEAM_SELECTIVITY = 1 / 32
+DEFAULT_THRESHOLD_SELECTIVITY = 1 / 2
+
+
+def is_nothing(matcher):
+    return isinstance(matcher, Or) and not matcher.matchers
+
+
+class Optimizer:
+    def __init__(self, index=None, season=None):
+        self._index = index
+        self._season = season
+
+    def optimize(self, matcher):
+        if isinstance(matcher, And):
+            return self._optimize_and(matcher)
+        if isinstance(matcher, Or):
+            return self._optimize_or(matcher)
+        if isinstance(matcher, Not):
+            return self._optimize_not(matcher)
+        if isinstance(matcher, InSeason) and self._season is not None:
+            return All() if self._season in matcher.seasons else Or()
+
+        return matcher
+
+    def selectivity(self, matcher):
+        if isinstance(matcher, All):
+            return 1.0
+        if isinstance(matcher, Not):
+            return 1.0 - self.selectivity(matcher.matcher)
+        if isinstance(matcher, And):
+            result = 1.0
+            for child in matcher.matchers:
+                result *= self.selectivity(child)
+            return result
+        if isinstance(matcher, Or):
+            result = 1.0
+            for child in matcher.matchers:
+                result *= 1.0 - self.selectivity(child)
+            return 1.0 - result
+
+        return self._leaf_selectivity(matcher)
+
+    def cost(self, matcher):
+        if isinstance(matcher, (And, Or)):
+            return 1 + sum(self.cost(child) for child in matcher.matchers)
+        if isinstance(matcher, Not):
+            return 1 + self.cost(matcher.matcher)
+
+        return 1
+
+    def _leaf_selectivity(self, leaf):
+        if self._index is not None and len(self._index) > 0 and self._index.is_indexed(leaf):
+            return self._index.count(leaf) / len(self._index)
+        if isinstance(leaf, PlaysIn):
+            return DEFAULT_TEAM_SELECTIVITY
+
+        return DEFAULT_THRESHOLD_SELECTIVITY
+
+    def _optimize_and(self, matcher):
+        children = []
+
+        for child in self._flatten(matcher, And):
+            if is_nothing(child):
+                return Or()
+            if not isinstance(child, All):
+                children.append(child)
+
+        children = self._merge_thresholds(children, max, min)
+
+        teams = {child.team for child in children if isinstance(child, PlaysIn)}
+        if len(teams) > 1:
+            return Or()
+
+        if not children:
+            return All()
+        if len(children) == 1:
+            return children[0]
+
+        children.sort(key=lambda child: (self.selectivity(child), self.cost(child), repr(child)))
+
+        return And(*children)
+
+    def _optimize_or(self, matcher):
+        children = []
+
+        for child in self._flatten(matcher, Or):
+            if isinstance(child, All):
+                return All()
+            if not is_nothing(child):
+                children.append(child)
+
+        children = self._merge_thresholds(children, min, max)
+
+        if len(children) == 1:
+            return children[0]
+
+        children.sort(key=lambda child: (-self.selectivity(child), self.cost(child), repr(child)))
+
+        return Or(*children)
+
+    def _optimize_not(self, matcher):
+        child = self.optimize(matcher.matcher)
+
+        if isinstance(child, Not):
+            return child.matcher
+        if isinstance(child, All):
+            return Or()
+        if is_nothing(child):
+            return All()
+
+        return Not(child)
+
+    def _flatten(self, matcher, kind):
+        for child in matcher.matchers:
+            child = self.optimize(child)
+
+            if isinstance(child, kind) and child.matchers:
+                yield from child.matchers
+            else:
+                yield child
+
+    def _merge_thresholds(self, children, merge_at_least, merge_fewer_than):
+        merged = []
+        at_least = {}
+        fewer_than = {}
+        seen = set()
+
+        for child in children:
+            if isinstance(child, HasAtLeast):
+                at_least[child.attr] = merge_at_least(at_least.get(child.attr, child.value), child.value)
+            elif isinstance(child, HasFewerThan):
+                fewer_than[child.attr] = merge_fewer_than(fewer_than.get(child.attr, child.value), child.value)
+            elif isinstance(child, PlaysIn):
+                if child.team not in seen:
+                    seen.add(child.team)
+                    merged.append(child)
+            else:
+                merged.append(child)
+
+        merged.extend(HasAtLeast(value, attr) for attr, value in at_least.items())
+        merged.extend(HasFewerThan(value, attr) for attr, value in fewer_than.items())
+
+        return merged
+
+
+def optimize(matcher, index=None, season=None):
+    return Optimizer(index, season).optimize(matcher)
@@ -0,0 +1,110 @@
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from compiler import compile_matcher
+
+PARALLEL_THRESHOLD = 200_000
+COLUMN_FORMATS = (("team", "H"), ("goals", "i"), ("assists", "i"), ("points", "i"))
+
+_shard_state = {}
+
+
+class ShardTable:
+    def __init__(self, columns, team_codes, season):
+        self._columns = columns
+        self._team_codes = team_codes
+        self.season = season
+
+    def team_code(self, team):
+        return self._team_codes.get(team, -1)
+
+    def columns(self):
+        return self._columns
+
+
+def column_bytes(format_code, size):
+    itemsize = 2 if format_code == "H" else 4
+
+    return (size * itemsize + 7) // 8 * 8
+
+
+def column_views(buffer, size):
+    views = []
+    offset = 0
+
+    for _, format_code in COLUMN_FORMATS:
+        length = column_bytes(format_code, size)
+        views.append(buffer[offset:offset + length].cast(format_code)[:size])
+        offset += length
+
+    return views
+
+
+def _attach(name, size, team_codes, season):
+    memory = shared_memory.SharedMemory(name=name)
+    _shard_state["memory"] = memory
+    _shard_state["columns"] = column_views(memory.buf, size)
+    _shard_state["team_codes"] = team_codes
+    _shard_state["season"] = season
+
+
+def _match_shard(matcher, start, stop):
+    columns = tuple(column[start:stop] for column in _shard_state["columns"])
+    table = ShardTable(columns, _shard_state["team_codes"], _shard_state["season"])
+    mask = compile_matcher(matcher, table).mask(table)
+
+    return [start + row for row, hit in enumerate(mask) if hit]
+
+
+class ParallelExecutor:
+    def __init__(self, table, workers):
+        size = len(table)
+        self._size = size
+        self._workers = workers
+        self._memory = shared_memory.SharedMemory(
+            create=True,
+            size=max(8, sum(column_bytes(code, size) for _, code in COLUMN_FORMATS))
+        )
+        self._columns = column_views(self._memory.buf, size)
+
+        for view, (column, _) in zip(self._columns, COLUMN_FORMATS):
+            view[:] = getattr(table, column)
+
+        team_codes = {team: code for code, team in enumerate(table.team_names)}
+        self._pool = ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_attach,
+            initargs=(self._memory.name, size, team_codes, table.season)
+        )
+
+    def shards(self):
+        shard_size = max(1, -(-self._size // self._workers))
+
+        return [
+            (start, min(start + shard_size, self._size))
+            for start in range(0, self._size, shard_size)
+        ]
+
+    def matching_rows(self, matcher):
+        futures = [
+            self._pool.submit(_match_shard, matcher, start, stop)
+            for start, stop in self.shards()
+        ]
+
+        rows = []
+        for future in futures:
+            rows.extend(future.result())
+
+        return rows
+
+    def update_row(self, table, row):
+        for view, (column, _) in zip(self._columns, COLUMN_FORMATS):
+            view[row] = getattr(table, column)[row]
+
+    def close(self):
+        self._pool.shutdown()
+
+        for view in self._columns:
+            view.release()
+
+        self._memory.close()
+        self._memory.unlink()
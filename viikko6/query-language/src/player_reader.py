@@ -3,14 +3,14 @@ from player import Player
 
 
 class PlayerReader:
-    def __init__(self, url):
+    def __init__(self, url, cache=None):
         self._url = url
+        self._cache = cache
 
     def get_players(self):
-        players_file = request.urlopen(self._url)
         players = []
 
-        for line in players_file:
+        for line in self._lines():
             decoded_line = line.decode("utf-8")
             parts = decoded_line.split(";")
 
@@ -25,3 +25,11 @@ class PlayerReader:
                 players.append(player)
 
         return players
+
+    def _lines(self):
+        if self._cache is None:
+            with request.urlopen(self._url) as players_file:
+                yield from players_file
+        else:
+            with self._cache.open(self._url) as players_file:
+                yield from iter(players_file.readline, b"")
@@ -0,0 +1,84 @@
+from array import array
+from player import Player
+
+
+class PlayerTable:
+    def __init__(self, season=None):
+        self.season = season
+        self.names = []
+        self.team_names = []
+        self._team_codes = {}
+        self._rows_by_name = {}
+        self.team = array("H")
+        self.goals = array("i")
+        self.assists = array("i")
+        self.points = array("i")
+
+    @staticmethod
+    def from_players(players, season=None):
+        table = PlayerTable(season)
+
+        for player in players:
+            table.append(player.name, player.team, player.goals, player.assists)
+
+        return table
+
+    def append(self, name, team, goals, assists):
+        self._rows_by_name.setdefault(name, len(self.names))
+        self.names.append(name)
+        self.team.append(self._intern_team(team))
+        self.goals.append(goals)
+        self.assists.append(assists)
+        self.points.append(goals + assists)
+
+    def _intern_team(self, team):
+        code = self._team_codes.get(team)
+
+        if code is None:
+            code = len(self.team_names)
+            self._team_codes[team] = code
+            self.team_names.append(team)
+
+        return code
+
+    def row_of(self, name):
+        row = self._rows_by_name.get(name)
+
+        if row is None:
+            raise ValueError(f"Unknown player: {name}")
+
+        return row
+
+    def set_stats(self, row, goals, assists):
+        self.goals[row] = goals
+        self.assists[row] = assists
+        self.points[row] = goals + assists
+
+    def team_code(self, team):
+        return self._team_codes.get(team, -1)
+
+    def columns(self):
+        return (self.team, self.goals, self.assists, self.points)
+
+    def player(self, row):
+        return Player(
+            self.names[row],
+            self.team_names[self.team[row]],
+            self.goals[row],
+            self.assists[row],
+            season=self.season
+        )
+
+    def iter_players(self, rows):
+        # sarakkeet haetaan paikallisiin muuttujiin kerran koko rivijoukolle
+        names, team_names, team = self.names, self.team_names, self.team
+        goals, assists, season = self.goals, self.assists, self.season
+
+        for row in rows:
+            yield Player(names[row], team_names[team[row]], goals[row], assists[row], season=season)
+
+    def players(self, rows):
+        return list(self.iter_players(rows))
+
+    def __len__(self):
+        return len(self.names)
@@ -0,0 +1,46 @@
+from collections import OrderedDict
+
+
+class QueryCache:
+    def __init__(self, maxsize=256):
+        self._maxsize = maxsize
+        self._results = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, matcher):
+        result = self._results.get(matcher)
+
+        if result is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._results.move_to_end(matcher)
+
+        return result
+
+    def peek(self, matcher):
+        return self._results.get(matcher)
+
+    def put(self, matcher, result):
+        self._results[matcher] = result
+        self._results.move_to_end(matcher)
+
+        if len(self._results) > self._maxsize:
+            self._results.popitem(last=False)
+
+    def update_all(self, update):
+        for matcher, result in self._results.items():
+            self._results[matcher] = update(matcher, result)
+
+    def clear(self):
+        self._results.clear()
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._results),
+            "maxsize": self._maxsize
+        }
@@ -0,0 +1,160 @@
+import re
+from functools import lru_cache
+from matchers import And, Or, Not, All, PlaysIn, HasAtLeast, HasFewerThan, InSeason, COLUMNS
+
+TOKEN_PATTERN = re.compile(r"\s*(?:(\d{4}-\d{2})|(\d+)|(>=|<=|!=|=|<|>)|([()])|([A-Za-z_][A-Za-z0-9_]*))")
+KEYWORDS = ("and", "or", "not", "all")
+
+
+class QuerySyntaxError(Exception):
+    pass
+
+
+def tokenize(text):
+    tokens = []
+    position = 0
+    text = text.rstrip()
+
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+
+        if not match:
+            raise QuerySyntaxError(f"Unexpected character at {position}: {text[position:]!r}")
+
+        season, number, operator, paren, word = match.groups()
+
+        if season is not None:
+            tokens.append(("season", season))
+        elif number is not None:
+            tokens.append(("number", int(number)))
+        elif operator is not None:
+            tokens.append(("operator", operator))
+        elif paren is not None:
+            tokens.append((paren, paren))
+        elif word.lower() in KEYWORDS:
+            tokens.append((word.lower(), word))
+        else:
+            tokens.append(("word", word))
+
+        position = match.end()
+
+    return tokens
+
+
+class QueryParser:
+    def __init__(self, text):
+        self._tokens = tokenize(text)
+        self._position = 0
+
+    def parse(self):
+        if not self._tokens:
+            return All()
+
+        matcher = self._parse_or()
+
+        if self._position < len(self._tokens):
+            raise QuerySyntaxError(f"Unexpected token: {self._tokens[self._position][1]!r}")
+
+        return matcher
+
+    def _peek(self):
+        if self._position < len(self._tokens):
+            return self._tokens[self._position][0]
+
+        return None
+
+    def _take(self, kind):
+        if self._peek() != kind:
+            found = self._tokens[self._position][1] if self._peek() else "end of query"
+            raise QuerySyntaxError(f"Expected {kind}, found {found!r}")
+
+        value = self._tokens[self._position][1]
+        self._position += 1
+
+        return value
+
+    def _parse_or(self):
+        matchers = [self._parse_and()]
+
+        while self._peek() == "or":
+            self._take("or")
+            matchers.append(self._parse_and())
+
+        return matchers[0] if len(matchers) == 1 else Or(*matchers)
+
+    def _parse_and(self):
+        matchers = [self._parse_not()]
+
+        while self._peek() == "and":
+            self._take("and")
+            matchers.append(self._parse_not())
+
+        return matchers[0] if len(matchers) == 1 else And(*matchers)
+
+    def _parse_not(self):
+        if self._peek() == "not":
+            self._take("not")
+            return Not(self._parse_not())
+
+        return self._parse_term()
+
+    def _parse_term(self):
+        if self._peek() == "(":
+            self._take("(")
+            matcher = self._parse_or()
+            self._take(")")
+            return matcher
+
+        if self._peek() == "all":
+            self._take("all")
+            return All()
+
+        return self._parse_comparison()
+
+    def _parse_comparison(self):
+        attr = self._take("word")
+        operator = self._take("operator")
+
+        if attr == "team":
+            team = self._take("word")
+
+            if operator == "=":
+                return PlaysIn(team)
+            if operator == "!=":
+                return Not(PlaysIn(team))
+
+            raise QuerySyntaxError(f"Operator {operator!r} is not supported for team")
+
+        if attr == "season":
+            season = self._take("season")
+
+            if operator == "=":
+                return InSeason(season)
+            if operator == "!=":
+                return Not(InSeason(season))
+
+            raise QuerySyntaxError(f"Operator {operator!r} is not supported for season")
+
+        if attr not in COLUMNS:
+            raise QuerySyntaxError(f"Unknown attribute: {attr!r}")
+
+        return self._threshold(attr, operator, self._take("number"))
+
+    def _threshold(self, attr, operator, value):
+        if operator == ">=":
+            return HasAtLeast(value, attr)
+        if operator == ">":
+            return HasAtLeast(value + 1, attr)
+        if operator == "<":
+            return HasFewerThan(value, attr)
+        if operator == "<=":
+            return HasFewerThan(value + 1, attr)
+        if operator == "=":
+            return And(HasAtLeast(value, attr), HasFewerThan(value + 1, attr))
+
+        return Not(And(HasAtLeast(value, attr), HasFewerThan(value + 1, attr)))
+
+
+@lru_cache(maxsize=1024)
+def parse_query(text):
+    return QueryParser(text).parse()
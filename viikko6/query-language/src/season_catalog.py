@@ -0,0 +1,63 @@
+from concurrent.futures import ThreadPoolExecutor
+from heapq import nlargest
+from player_reader import PlayerReader
+from statistics import Statistics
+from optimizer import optimize, is_nothing
+
+SEASONS = (
+    "2018-19",
+    "2019-20",
+    "2020-21",
+    "2021-22",
+    "2022-23",
+    "2023-24",
+    "2024-25",
+    "2025-26"
+)
+SEASON_URL = "https://studies.cs.helsinki.fi/nhlstats/{season}/players.txt"
+
+
+class SeasonCatalog:
+    def __init__(self, readers, max_workers=8):
+        def load(season):
+            return Statistics(readers[season], season=season)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            self._partitions = dict(zip(readers, executor.map(load, readers)))
+
+    @staticmethod
+    def from_urls(seasons=SEASONS, max_workers=8, cache=None):
+        readers = {
+            season: PlayerReader(SEASON_URL.format(season=season), cache)
+            for season in seasons
+        }
+
+        return SeasonCatalog(readers, max_workers)
+
+    def seasons(self):
+        return list(self._partitions)
+
+    def season(self, season):
+        return self._partitions[season]
+
+    def partitions_for(self, matcher):
+        return [
+            stats for season, stats in self._partitions.items()
+            if not is_nothing(optimize(matcher, season=season))
+        ]
+
+    def matches(self, matcher):
+        players = []
+
+        for stats in self.partitions_for(matcher):
+            players.extend(stats.matches(matcher))
+
+        return players
+
+    def top_matches(self, matcher, how_many, key="points"):
+        candidates = []
+
+        for stats in self.partitions_for(matcher):
+            candidates.extend(stats.top_matches(matcher, how_many, key))
+
+        return nlargest(how_many, candidates, key=lambda player: getattr(player, key))
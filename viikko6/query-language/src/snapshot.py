@@ -0,0 +1,152 @@
+import mmap
+import os
+import struct
+from player import Player
+
+MAGIC = b"NHLS"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIII")
+STRING_COLUMNS = ("name", "team", "nationality")
+INT_COLUMNS = ("goals", "assists")
+
+
+class SnapshotError(Exception):
+    pass
+
+
+def padded(length):
+    return (length + 7) // 8 * 8
+
+
+def read_header(snapshot_file, path):
+    header = snapshot_file.read(HEADER.size)
+
+    if len(header) < HEADER.size:
+        raise SnapshotError(f"{path} is not a version {VERSION} player snapshot")
+
+    magic, version, _, rows, string_count, string_bytes = HEADER.unpack(header)
+
+    if magic != MAGIC or version != VERSION:
+        raise SnapshotError(f"{path} is not a version {VERSION} player snapshot")
+
+    # katkennut tiedosto tunnistetaan otsakkeen lukumäärien perusteella ennen kuin sarakkeita luetaan
+    columns = len(STRING_COLUMNS + INT_COLUMNS) * padded(rows * 4)
+    end = padded(HEADER.size) + columns + padded((string_count + 1) * 4) + string_bytes
+    size = os.fstat(snapshot_file.fileno()).st_size
+
+    if size < end:
+        raise SnapshotError(f"{path} is truncated: expected {end} bytes, found {size}")
+
+    return rows, string_count, string_bytes
+
+
+def encode_players(players):
+    strings = {}
+    columns = {column: [] for column in STRING_COLUMNS + INT_COLUMNS}
+
+    for player in players:
+        for column in STRING_COLUMNS:
+            columns[column].append(strings.setdefault(getattr(player, column, None) or "", len(strings)))
+        for column in INT_COLUMNS:
+            columns[column].append(getattr(player, column))
+
+    return columns, [text.encode("utf-8") for text in strings]
+
+
+def write_snapshot(path, players):
+    columns, encoded = encode_players(players)
+    offsets = [0]
+    for text in encoded:
+        offsets.append(offsets[-1] + len(text))
+
+    rows = len(columns["goals"])
+    parts = [HEADER.pack(MAGIC, VERSION, 0, rows, len(encoded), offsets[-1])]
+    parts.extend(struct.pack(f"<{rows}I", *columns[column]) for column in STRING_COLUMNS)
+    parts.extend(struct.pack(f"<{rows}i", *columns[column]) for column in INT_COLUMNS)
+    parts.append(struct.pack(f"<{len(offsets)}I", *offsets))
+    parts.append(b"".join(encoded))
+
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+
+    with open(temporary_path, "wb") as target:
+        for part in parts:
+            target.write(part)
+            target.write(bytes(padded(len(part)) - len(part)))
+
+    os.replace(temporary_path, path)
+
+
+class Snapshot:
+    def __init__(self, path):
+        with open(path, "rb") as snapshot_file:
+            self.rows, string_count, string_bytes = read_header(snapshot_file, path)
+            self._map = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._views = []
+        self.columns = {}
+
+        with memoryview(self._map) as buffer:
+            offset = padded(HEADER.size)
+
+            for column in STRING_COLUMNS + INT_COLUMNS:
+                self.columns[column] = self._view(buffer, offset, self.rows, "I" if column in STRING_COLUMNS else "i")
+                offset += padded(self.rows * 4)
+
+            self._offsets = self._view(buffer, offset, string_count + 1, "I")
+            self._strings = self._view(buffer, offset + padded((string_count + 1) * 4), string_bytes, "B")
+
+    def _view(self, buffer, offset, count, format_code):
+        view = buffer[offset:offset + count * struct.calcsize(format_code)].cast(format_code)
+        self._views.append(view)
+
+        return view
+
+    def string(self, string_id):
+        return bytes(self._strings[self._offsets[string_id]:self._offsets[string_id + 1]]).decode("utf-8")
+
+    def strings(self):
+        cache = {}
+
+        def string(string_id):
+            if string_id not in cache:
+                cache[string_id] = self.string(string_id)
+            return cache[string_id]
+
+        return string
+
+    def __len__(self):
+        return self.rows
+
+    def close(self):
+        for view in self._views:
+            view.release()
+
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class SnapshotReader:
+    def __init__(self, path):
+        self._path = path
+
+    def get_players(self):
+        players = []
+
+        with Snapshot(self._path) as snapshot:
+            string = snapshot.strings()
+            columns = snapshot.columns
+
+            for row in range(len(snapshot)):
+                players.append(Player(
+                    string(columns["name"][row]),
+                    string(columns["team"][row]),
+                    columns["goals"][row],
+                    columns["assists"][row]
+                ))
+
+        return players
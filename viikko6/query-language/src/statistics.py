@@ -1,42 +1,232 @@
 from player_reader import PlayerReader
+from player_table import PlayerTable
+from compiler import compile_matcher
+from indexes import TableIndex
+from name_index import NameIndex
+from optimizer import optimize
+from query_cache import QueryCache
+from query_parser import parse_query
+from parallel import ParallelExecutor, PARALLEL_THRESHOLD
+from matchers import And, Or, Not, All, column_name
+from heapq import nlargest
+from itertools import islice
+import bitset
 
-
-def sort_by_points(player):
-    return player.points
+CANDIDATE_FRACTION = 4
 
 
 class Statistics:
-    def __init__(self, player_reader):
-        self._players = player_reader.get_players()
+    def __init__(self, player_reader, indexed=True, cache_size=256, season=None,
+                 workers=1, parallel_threshold=PARALLEL_THRESHOLD):
+        self._player_reader = player_reader
+        self._season = season
+        self._indexed = indexed
+        self._workers = workers
+        self._parallel_threshold = parallel_threshold
+        self._executor = None
+        self._cache = QueryCache(cache_size)
+        self._plans = QueryCache(cache_size)
+        self.reload()
+
+    def reload(self):
+        self._table = PlayerTable.from_players(self._player_reader.get_players(), self._season)
+        self._index = TableIndex(self._table) if self._indexed else None
+        self._name_index = NameIndex(self._table.names)
+        self._cache.clear()
+        self._plans.clear()
+        self.close()
+
+        if self._index is None and self._workers > 1 and len(self._table) >= self._parallel_threshold:
+            self._executor = ParallelExecutor(self._table, self._workers)
+
+    def close(self):
+        if self._executor:
+            self._executor.close()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    @property
+    def season(self):
+        return self._season
+
+    def update_player(self, name, goals=0, assists=0):
+        table = self._table
+        row = table.row_of(name)
+        old_values = self._stat_values(row)
+
+        table.set_stats(row, table.goals[row] + goals, table.assists[row] + assists)
+
+        if self._index:
+            self._index.update(row, old_values, self._stat_values(row))
+        if self._executor:
+            self._executor.update_row(table, row)
+
+        player = table.player(row)
+        bit = 1 << row
+
+        def update_bits(matcher, bits):
+            # bitjoukko kopioidaan vain, jos rivin jäsenyys todella muuttuu
+            if bitset.contains(bits, row) == matcher.test(player):
+                return bits
+
+            return bits ^ bit
+
+        self._cache.update_all(update_bits)
+
+        return player
+
+    def _stat_values(self, row):
+        return {
+            "goals": self._table.goals[row],
+            "assists": self._table.assists[row],
+            "points": self._table.points[row]
+        }
+
+    def cache_info(self):
+        return self._cache.info()
 
     def search(self, name):
-        for player in self._players:
-            if name in player.name:
-                return player
+        row = self._name_index.find_first(name)
+
+        return self._table.player(row) if row is not None else None
 
-        return None
+    def search_all(self, name, ignore_case=False):
+        return self._table.players(self._name_index.find_all(name, ignore_case))
+
+    def search_prefix(self, prefix, ignore_case=False):
+        return self._table.players(self._name_index.find_prefix(prefix, ignore_case))
 
     def team(self, team_name):
-        players_of_team = filter(
-            lambda player: player.team == team_name,
-            self._players
-        )
+        if self._index:
+            return self._table.players(self._index.team_rows(team_name))
 
-        return list(players_of_team)
+        code = self._table.team_code(team_name)
+        rows = [row for row, team in enumerate(self._table.team) if team == code]
 
-    def top_scorers(self, how_many):
-        sorted_players = sorted(
-            self._players,
-            reverse=True,
-            key=sort_by_points
-        )
+        return self._table.players(rows)
 
-        return sorted_players[:how_many]
+    def top_scorers(self, how_many):
+        return self.top_matches(All(), how_many)
 
     def matches(self, matcher):
-        matching_players = filter(
-            lambda player: matcher.test(player),
-            self._players
+        return list(self.iter_matches(matcher))
+
+    def query(self, text, limit=None):
+        return list(self._iter_plan(self._plan(text), limit))
+
+    def iter_matches(self, matcher, limit=None):
+        return self._iter_plan(optimize(matcher, self._index, self._season), limit)
+
+    def top_matches(self, matcher, how_many, key="points"):
+        values = getattr(self._table, column_name(key))
+        rows = nlargest(
+            how_many,
+            self._rows(optimize(matcher, self._index, self._season)),
+            key=values.__getitem__
         )
 
-        return list(matching_players)
+        return self._table.players(rows)
+
+    def _plan(self, text):
+        plan = self._plans.get(text)
+
+        if plan is None:
+            plan = optimize(parse_query(text), self._index, self._season)
+            self._plans.put(text, plan)
+
+        return plan
+
+    def _iter_plan(self, plan, limit):
+        if limit is None:
+            rows = self._rows(plan)
+        else:
+            rows = islice(self._stream_rows(plan), limit)
+
+        return self._table.iter_players(rows)
+
+    def _rows(self, matcher):
+        if isinstance(matcher, All):
+            return range(len(self._table))
+
+        return bitset.rows(self._evaluate(matcher))
+
+    def _stream_rows(self, matcher):
+        bits = self._cache.get(matcher)
+
+        if bits is not None:
+            return bitset.rows(bits)
+        if isinstance(matcher, All):
+            return range(len(self._table))
+
+        candidates = self._index.candidates(matcher) if self._index else None
+        rows = range(len(self._table)) if candidates is None else candidates
+
+        return compile_matcher(matcher, self._table).iter_rows(self._table, rows)
+
+    def _evaluate(self, matcher):
+        bits = self._cache.get(matcher)
+
+        if bits is None:
+            bits = self._compute(matcher)
+            self._cache.put(matcher, bits)
+
+        return bits
+
+    def _compute(self, matcher):
+        if isinstance(matcher, All):
+            return bitset.full(len(self._table))
+        if self._executor:
+            return bitset.from_rows(self._executor.matching_rows(matcher), len(self._table))
+
+        # indeksi rajaa ehdokasrivit vain, jos niitä on selvästi alle koko taulun
+        max_rows = len(self._table) // CANDIDATE_FRACTION
+        candidates = self._index.candidates(matcher, max_rows) if self._index else None
+
+        if candidates is not None:
+            rows = compile_matcher(matcher, self._table).filter(self._table, candidates)
+            return bitset.from_rows(rows, len(self._table))
+        if isinstance(matcher, Not):
+            return self._compute_not(matcher)
+        if isinstance(matcher, (And, Or)):
+            return self._compute_children(matcher)
+
+        return self._scan(matcher)
+
+    def _compute_not(self, matcher):
+        bits = self._cache.peek(matcher.matcher)
+
+        if bits is None:
+            return self._scan(matcher)
+
+        return bitset.full(len(self._table)) & ~bits
+
+    def _compute_children(self, matcher):
+        # välimuistissa valmiina olevat alikyselyt käytetään sellaisinaan, loput arvioidaan yhdellä läpikäynnillä
+        uncached = []
+        results = []
+
+        for child in matcher.matchers:
+            bits = self._cache.peek(child)
+
+            if bits is None:
+                uncached.append(child)
+            else:
+                results.append(bits)
+
+        if uncached or not results:
+            results.append(self._scan(type(matcher)(*uncached)))
+
+        bits = results[0]
+
+        for other in results[1:]:
+            bits = bits & other if isinstance(matcher, And) else bits | other
+
+        return bits
+
+    def _scan(self, matcher):
+        return bitset.from_mask(compile_matcher(matcher, self._table).mask(self._table))
@@ -0,0 +1,23 @@
+import unittest
+import bitset
+
+
+class TestBitset(unittest.TestCase):
+    def test_maski_ja_rivit_vastaavat_toisiaan(self):
+        mask = [row % 3 == 0 or row == 17 for row in range(70)]
+        rows = [row for row, hit in enumerate(mask) if hit]
+
+        self.assertEqual(bitset.from_mask(mask), bitset.from_rows(rows, len(mask)))
+        self.assertEqual(list(bitset.rows(bitset.from_mask(mask))), rows)
+
+    def test_tyhja_maski(self):
+        self.assertEqual(bitset.from_mask([]), 0)
+        self.assertEqual(bitset.from_mask([False] * 10), 0)
+        self.assertEqual(list(bitset.rows(0)), [])
+
+    def test_jasenyys(self):
+        bits = bitset.from_rows([0, 9, 64], 100)
+
+        self.assertTrue(bitset.contains(bits, 64))
+        self.assertFalse(bitset.contains(bits, 63))
+        self.assertEqual(bitset.full(3), 0b111)
@@ -0,0 +1,60 @@
+import unittest
+from matchers import And, Or, Not, All, PlaysIn, HasAtLeast, HasFewerThan, InSeason
+from optimizer import optimize, is_nothing
+
+
+class TestOptimizer(unittest.TestCase):
+    def test_kaksinkertainen_negaatio_poistuu(self):
+        self.assertEqual(optimize(Not(Not(PlaysIn("PHI")))), PlaysIn("PHI"))
+
+    def test_negaatio_kaantaa_kaikki_ja_ei_mitaan(self):
+        self.assertTrue(is_nothing(optimize(Not(All()))))
+        self.assertEqual(optimize(Not(Or())), All())
+
+    def test_all_poistuu_and_lausekkeesta(self):
+        self.assertEqual(optimize(And(All(), PlaysIn("PHI"), All())), PlaysIn("PHI"))
+        self.assertEqual(optimize(And(All(), All())), All())
+
+    def test_all_tekee_or_lausekkeesta_kaikki(self):
+        self.assertEqual(optimize(Or(PlaysIn("PHI"), All())), All())
+
+    def test_sisakkaiset_lausekkeet_litistetaan(self):
+        optimized = optimize(And(PlaysIn("PHI"), And(HasAtLeast(5, "goals"), And(HasFewerThan(9, "assists")))))
+
+        self.assertEqual(set(optimized.matchers), {PlaysIn("PHI"), HasAtLeast(5, "goals"), HasFewerThan(9, "assists")})
+
+    def test_and_yhdistaa_kynnysarvot_tiukimmiksi(self):
+        optimized = optimize(And(
+            HasAtLeast(5, "goals"), HasAtLeast(10, "goals"), HasFewerThan(30, "goals"), HasFewerThan(20, "goals")
+        ))
+
+        self.assertEqual(set(optimized.matchers), {HasAtLeast(10, "goals"), HasFewerThan(20, "goals")})
+
+    def test_or_yhdistaa_kynnysarvot_loysimmiksi(self):
+        self.assertEqual(optimize(Or(HasAtLeast(5, "goals"), HasAtLeast(10, "goals"))), HasAtLeast(5, "goals"))
+        self.assertEqual(optimize(Or(HasFewerThan(5, "goals"), HasFewerThan(10, "goals"))), HasFewerThan(10, "goals"))
+
+    def test_eri_ominaisuuksien_kynnysarvoja_ei_yhdisteta(self):
+        optimized = optimize(And(HasAtLeast(5, "goals"), HasAtLeast(10, "assists")))
+
+        self.assertEqual(set(optimized.matchers), {HasAtLeast(5, "goals"), HasAtLeast(10, "assists")})
+
+    def test_ristiriitaiset_joukkueet_eivat_loyda_mitaan(self):
+        self.assertTrue(is_nothing(optimize(And(PlaysIn("PHI"), PlaysIn("EDM")))))
+        self.assertEqual(optimize(And(PlaysIn("PHI"), PlaysIn("PHI"))), PlaysIn("PHI"))
+
+    def test_tyhja_alilauseke_tyhjentaa_and_lausekkeen(self):
+        self.assertTrue(is_nothing(optimize(And(HasAtLeast(5, "goals"), Not(All())))))
+        self.assertEqual(optimize(Or(Not(All()), PlaysIn("PHI"))), PlaysIn("PHI"))
+
+    def test_kausi_karsitaan_tunnetulla_kaudella(self):
+        matcher = And(InSeason("2024-25"), PlaysIn("PHI"))
+
+        self.assertEqual(optimize(matcher, season="2024-25"), PlaysIn("PHI"))
+        self.assertTrue(is_nothing(optimize(matcher, season="2023-24")))
+        self.assertEqual(set(optimize(matcher).matchers), {InSeason("2024-25"), PlaysIn("PHI")})
+
+    def test_valikoivin_ehto_arvioidaan_ensin(self):
+        optimized = optimize(And(HasAtLeast(5, "goals"), PlaysIn("PHI")))
+
+        self.assertEqual(optimized.matchers[0], PlaysIn("PHI"))
@@ -0,0 +1,64 @@
+import unittest
+from matchers import And, Or, Not, All, PlaysIn, HasAtLeast, HasFewerThan, InSeason
+from query_parser import QuerySyntaxError, parse_query, tokenize
+
+
+class TestQueryParser(unittest.TestCase):
+    def test_tyhja_kysely_loytaa_kaikki(self):
+        self.assertEqual(parse_query(""), All())
+        self.assertEqual(parse_query("all"), All())
+
+    def test_and_sitoo_tiukemmin_kuin_or(self):
+        self.assertEqual(
+            parse_query("team = PHI or team = EDM and goals >= 10"),
+            Or(PlaysIn("PHI"), And(PlaysIn("EDM"), HasAtLeast(10, "goals")))
+        )
+
+    def test_sulut_ohittavat_presedenssin(self):
+        self.assertEqual(
+            parse_query("(team = PHI or team = EDM) and goals >= 10"),
+            And(Or(PlaysIn("PHI"), PlaysIn("EDM")), HasAtLeast(10, "goals"))
+        )
+
+    def test_not_sitoo_tiukimmin(self):
+        self.assertEqual(
+            parse_query("not team = PHI and goals >= 10"),
+            And(Not(PlaysIn("PHI")), HasAtLeast(10, "goals"))
+        )
+        self.assertEqual(parse_query("NOT not team = PHI"), Not(Not(PlaysIn("PHI"))))
+
+    def test_vertailuoperaattorit_muunnetaan_kynnysarvoiksi(self):
+        self.assertEqual(parse_query("goals > 10"), HasAtLeast(11, "goals"))
+        self.assertEqual(parse_query("goals <= 10"), HasFewerThan(11, "goals"))
+        self.assertEqual(parse_query("assists < 5"), HasFewerThan(5, "assists"))
+        self.assertEqual(parse_query("points = 7"), And(HasAtLeast(7, "points"), HasFewerThan(8, "points")))
+        self.assertEqual(parse_query("points != 7"), Not(And(HasAtLeast(7, "points"), HasFewerThan(8, "points"))))
+
+    def test_joukkue_ja_kausi(self):
+        self.assertEqual(parse_query("team != NYR"), Not(PlaysIn("NYR")))
+        self.assertEqual(parse_query("season = 2024-25"), InSeason("2024-25"))
+
+    def test_sanasto(self):
+        self.assertEqual(
+            tokenize("goals>=10 AND team=PHI"),
+            [("word", "goals"), ("operator", ">="), ("number", 10), ("and", "AND"),
+             ("word", "team"), ("operator", "="), ("word", "PHI")]
+        )
+
+    def test_syntaksivirheet(self):
+        for text in (
+            "goals >= ",
+            "goals 10",
+            "(team = PHI",
+            "team = PHI)",
+            "team = PHI team = EDM",
+            "hits >= 10",
+            "team >= PHI",
+            "season < 2024-25",
+            "goals >= 10 and",
+            "goals >= 1.5",
+            "goals >= PHI",
+        ):
+            with self.subTest(text=text):
+                with self.assertRaises(QuerySyntaxError):
+                    parse_query(text)
@@ -0,0 +1,58 @@
+import unittest
+from matchers import And, Or, Not, PlaysIn, HasAtLeast, InSeason
+from player import Player
+from query_parser import parse_query
+from season_catalog import SeasonCatalog
+
+SEASON_ROWS = {
+    "2022-23": [("Kurri", "EDM", 30, 40), ("Selänne", "ANA", 20, 25)],
+    "2023-24": [("Kurri", "EDM", 35, 50), ("Koivu", "MIN", 10, 30)],
+    "2024-25": [("Kurri", "EDM", 12, 15), ("Barkov", "FLA", 40, 40)],
+}
+
+
+class PlayerReaderStub:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def get_players(self):
+        return [Player(*row) for row in self.rows]
+
+
+class TestSeasonCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = SeasonCatalog({season: PlayerReaderStub(rows) for season, rows in SEASON_ROWS.items()})
+
+    def seasons_of(self, partitions):
+        return [stats.season for stats in partitions]
+
+    def test_osiot_rajataan_kauden_mukaan(self):
+        self.assertEqual(self.seasons_of(self.catalog.partitions_for(InSeason("2023-24"))), ["2023-24"])
+        self.assertEqual(
+            self.seasons_of(self.catalog.partitions_for(And(PlaysIn("EDM"), Not(InSeason("2022-23"))))),
+            ["2023-24", "2024-25"]
+        )
+        self.assertEqual(self.catalog.partitions_for(InSeason("1999-00")), [])
+        self.assertEqual(self.seasons_of(self.catalog.partitions_for(PlaysIn("EDM"))), list(SEASON_ROWS))
+
+    def test_pelaajat_merkitaan_osion_kaudella(self):
+        players = self.catalog.matches(Or(InSeason("2022-23"), HasAtLeast(40, "goals")))
+
+        self.assertEqual(
+            [(player.name, player.season) for player in players],
+            [("Kurri", "2022-23"), ("Selänne", "2022-23"), ("Barkov", "2024-25")]
+        )
+
+    def test_tekstikysely_kaudelle(self):
+        players = self.catalog.matches(parse_query("season = 2023-24 and team = EDM"))
+
+        self.assertEqual([(player.name, player.goals, player.season) for player in players], [("Kurri", 35, "2023-24")])
+
+    def test_parhaat_yhdistetaan_osioista(self):
+        top = self.catalog.top_matches(PlaysIn("EDM"), 2)
+
+        self.assertEqual([(player.season, player.points) for player in top], [("2023-24", 85), ("2022-23", 70)])
+
+        top = self.catalog.top_matches(HasAtLeast(20, "goals"), 3, key="goals")
+
+        self.assertEqual([(player.name, player.goals) for player in top], [("Barkov", 40), ("Kurri", 35), ("Kurri", 30)])
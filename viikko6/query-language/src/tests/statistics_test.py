@@ -0,0 +1,128 @@
+import random
+import unittest
+from matchers import QueryBuilder, And, Or, Not, All, PlaysIn, HasAtLeast, HasFewerThan
+from player import Player
+from query_parser import parse_query
+from statistics import Statistics
+
+TEAMS = ["PHI", "EDM", "NYR", "BOS", "COL"]
+
+QUERIES = [
+    "team = PHI and goals >= 10",
+    "team = EDM or assists < 5",
+    "not (team = NYR or points > 40)",
+    "goals >= 5 and goals >= 12 and assists <= 20",
+    "team = PHI and team = EDM",
+    "points = 30 or team != BOS",
+    "not not goals < 3",
+    "all",
+]
+
+
+class PlayerReaderStub:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def get_players(self):
+        return [Player(*row) for row in self.rows]
+
+
+def generate_rows(how_many, seed=1):
+    rng = random.Random(seed)
+
+    return [[f"Player {i}", rng.choice(TEAMS), rng.randint(0, 25), rng.randint(0, 30)] for i in range(how_many)]
+
+
+def matchers():
+    query = QueryBuilder()
+
+    return [parse_query(text) for text in QUERIES] + [
+        query.plays_in("COL").has_at_least(10, "goals").has_fewer_than(20, "assists").build(),
+        query.one_of(query.plays_in("PHI"), query.plays_in("EDM").has_at_least(20, "points")).build(),
+        And(Not(HasAtLeast(5, "goals")), Not(PlaysIn("NYR"))),
+        Or(HasAtLeast(20, "goals"), HasFewerThan(3, "assists"), All()),
+        Not(Or()),
+    ]
+
+
+class TestStatistics(unittest.TestCase):
+    def setUp(self):
+        self.rows = generate_rows(300)
+        self.reader = PlayerReaderStub(self.rows)
+        self.variants = {
+            "cached": Statistics(self.reader),
+            "indexed": Statistics(self.reader, cache_size=0),
+            "unindexed": Statistics(self.reader, indexed=False, cache_size=0),
+            "parallel": Statistics(self.reader, indexed=False, cache_size=0, workers=2, parallel_threshold=0),
+        }
+
+    def tearDown(self):
+        for stats in self.variants.values():
+            stats.close()
+
+    def expected(self, matcher):
+        return [player.name for player in self.reader.get_players() if matcher.test(player)]
+
+    def assert_matches_test(self):
+        for name, stats in self.variants.items():
+            for matcher in matchers():
+                with self.subTest(variant=name, matcher=matcher):
+                    expected = self.expected(matcher)
+
+                    self.assertEqual([player.name for player in stats.matches(matcher)], expected)
+                    self.assertEqual([player.name for player in stats.iter_matches(matcher, limit=7)], expected[:7])
+
+    def test_kaikki_suorituspolut_vastaavat_matcherin_testia(self):
+        self.assert_matches_test()
+        # toisella kierroksella tulokset tulevat välimuistista
+        self.assert_matches_test()
+
+        self.assertGreater(self.variants["cached"].cache_info()["hits"], 0)
+
+    def test_tekstikysely_vastaa_matcheria(self):
+        for text in QUERIES:
+            with self.subTest(text=text):
+                expected = self.expected(parse_query(text))
+
+                self.assertEqual([player.name for player in self.variants["cached"].query(text)], expected)
+                self.assertEqual([player.name for player in self.variants["cached"].query(text, limit=3)], expected[:3])
+
+    def test_parhaat_pelaajat(self):
+        matcher = parse_query("team = PHI or goals >= 20")
+        expected = sorted(
+            (player for player in self.reader.get_players() if matcher.test(player)),
+            key=lambda player: -player.points
+        )
+
+        for name, stats in self.variants.items():
+            with self.subTest(variant=name):
+                top = stats.top_matches(matcher, 5)
+
+                self.assertEqual([player.points for player in top], [player.points for player in expected[:5]])
+
+    def test_paivitys_paivittaa_valimuistin(self):
+        self.assert_matches_test()
+
+        for row in (self.rows[0], self.rows[1], self.rows[2]):
+            row[2] += 15
+            row[3] -= 1
+            for stats in self.variants.values():
+                stats.update_player(row[0], goals=15, assists=-1)
+
+        self.assert_matches_test()
+
+    def test_uudelleenlataus_tyhjentaa_valimuistin(self):
+        matcher = parse_query("team = PHI and goals >= 10")
+
+        for stats in self.variants.values():
+            stats.matches(matcher)
+
+        self.rows[:] = generate_rows(200, seed=2)
+
+        for name, stats in self.variants.items():
+            with self.subTest(variant=name):
+                stats.reload()
+
+                self.assertEqual([player.name for player in stats.matches(matcher)], self.expected(matcher))
+
+        self.assertEqual(self.variants["cached"].cache_info()["size"], 1)